@@ -3,38 +3,47 @@
 Clockify CLI - Python implementation
 A modular command-line interface for Clockify time tracking.
 """
-import argparse
+from __future__ import annotations
+
+import os
 import sys
-from typing import Optional
-
-from modules.config import ClockifyConfig
-from modules.api_client import ClockifyAPI, ClockifyAPIError
-from modules.data_cache import DataCache
-from modules.client_manager import ClientManager
-from modules.project_manager import ProjectManager
-from modules.task_manager_new import TaskDescriptionManager
-from modules.time_tracker import TimeTracker
-from modules.pomodoro import PomodoroIntegration, PomodoroError
-from modules.events import PomodoroEventExtractor
-
-
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser with all commands and options."""
-    parser = argparse.ArgumentParser(
-        description="Clockify CLI - Time tracking and Pomodoro integration",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    # Global options
-    parser.add_argument("--token", help="Clockify API token")
-    parser.add_argument("--workspace-id", help="Workspace ID")
-    parser.add_argument("--project-id", help="Project ID")
-    parser.add_argument("--task-name", help="Task name (deprecated, use --description)")
-    parser.add_argument("--description", help="Time entry description")
-    
-    # Subcommands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
+from functools import cached_property, lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+# The API stack (requests, urllib3, ssl), argparse and the journal event
+# extractor are imported where they are used so that each invocation only
+# pays for what its command needs.
+
+# Pure diagnostics (and any that cost IPC round-trips) are only produced when
+# CLOCKIFY_DEBUG is set. "DEBUG: Raw argv=" and "DEBUG: Command=" are always
+# logged because modules.events reads them back from the journal.
+_DEBUG = bool(os.environ.get("CLOCKIFY_DEBUG"))
+
+if TYPE_CHECKING:
+    import argparse
+    from pathlib import Path
+    from modules.api_client import ClockifyAPI
+    from modules.config import ClockifyConfig
+    from modules.data_cache import DataCache
+    from modules.events import PomodoroEventExtractor
+    from modules.pomodoro import PomodoroIntegration
+    from modules.client_manager import ClientManager
+    from modules.project_manager import ProjectManager
+    from modules.task_manager_new import TaskDescriptionManager
+    from modules.time_tracker import TimeTracker
+    from typing import Callable
+
+    # Dispatch table signatures, typed so they compile to native calls under mypyc
+    TimeHandler = Callable[[argparse.Namespace, TimeTracker], int]
+    ClientHandler = Callable[[argparse.Namespace, ClientManager], int]
+    ProjectHandler = Callable[[argparse.Namespace, ProjectManager], int]
+    TaskHandler = Callable[[argparse.Namespace, TaskDescriptionManager], int]
+    CommandHandler = Callable[[argparse.Namespace, "Components"], int]
+
+
+def _build_time_parsers(subparsers: argparse._SubParsersAction) -> None:
+    """Register the start/stop family of time tracking commands."""
     # Start command
     start_parser = subparsers.add_parser("start", help="Start time tracking")
     start_parser.add_argument("enable", nargs="?", help="Pomodoro trigger (compatibility)")
@@ -56,11 +65,15 @@ def create_parser() -> argparse.ArgumentParser:
     
     # Complete command (alias for stop)
     complete_parser = subparsers.add_parser("complete", help="Complete current session")
-    
-    # Info command
+
+
+def _build_info_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the info command."""
     info_parser = subparsers.add_parser("info", help="Show current status")
 
-    # Client commands
+
+def _build_client_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register client commands."""
     client_parser = subparsers.add_parser("client", help="Client management")
     client_subparsers = client_parser.add_subparsers(dest="client_action")
 
@@ -69,7 +82,9 @@ def create_parser() -> argparse.ArgumentParser:
     client_set_parser = client_subparsers.add_parser("set", help="Set client by name")
     client_set_parser.add_argument("name", help="Client name")
 
-    # Project commands
+
+def _build_project_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register project commands."""
     project_parser = subparsers.add_parser("project", help="Project management")
     project_subparsers = project_parser.add_subparsers(dest="project_action")
     
@@ -77,8 +92,10 @@ def create_parser() -> argparse.ArgumentParser:
     project_select_parser = project_subparsers.add_parser("select", help="Interactively select project")
     project_set_parser = project_subparsers.add_parser("set", help="Set project by name")
     project_set_parser.add_argument("name", help="Project name")
-    
-    # Task commands
+
+
+def _build_task_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register task commands."""
     task_parser = subparsers.add_parser("task", help="Task management")
     task_subparsers = task_parser.add_subparsers(dest="task_action")
 
@@ -94,13 +111,19 @@ def create_parser() -> argparse.ArgumentParser:
     task_delete_parser = task_subparsers.add_parser("delete", help="Delete a formal task")
     task_delete_parser.add_argument("name", help="Task name")
 
-    # Project-Task combined command
+
+def _build_project_task_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the combined project-task command."""
     project_task_parser = subparsers.add_parser("project-task", help="Select project and task (auto-updates client)")
 
-    # Switch command - switch back to previous task
+
+def _build_switch_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the switch command - switch back to previous task."""
     switch_parser = subparsers.add_parser("switch", help="Switch back to previous task (like 'cd -' or 'git checkout -')")
 
-    # Events commands
+
+def _build_events_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register events commands."""
     events_parser = subparsers.add_parser("events", help="Pomodoro event logging")
     events_subparsers = events_parser.add_subparsers(dest="events_action")
 
@@ -112,11 +135,15 @@ def create_parser() -> argparse.ArgumentParser:
 
     events_clear_parser = events_subparsers.add_parser("clear", help="Clear all saved events")
 
-    # Legacy command aliases for compatibility
+
+def _build_legacy_parsers(subparsers: argparse._SubParsersAction) -> None:
+    """Register legacy command aliases for compatibility."""
     tasks_parser = subparsers.add_parser("tasks", help="List tasks (legacy alias)")
     projects_parser = subparsers.add_parser("projects", help="List projects (legacy alias)")
-    
-    # Pomodoro commands
+
+
+def _build_pomodoro_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register Pomodoro commands."""
     pomodoro_parser = subparsers.add_parser("pomodoro", help="Pomodoro timer control")
     pomodoro_subparsers = pomodoro_parser.add_subparsers(dest="pomodoro_action")
     
@@ -127,20 +154,404 @@ def create_parser() -> argparse.ArgumentParser:
     pomodoro_skip_parser = pomodoro_subparsers.add_parser("skip", help="Skip Pomodoro session")
     pomodoro_status_parser = pomodoro_subparsers.add_parser("status", help="Show Pomodoro status")
     pomodoro_sync_parser = pomodoro_subparsers.add_parser("sync", help="Sync Clockify with Pomodoro")
+
+
+# Subparser builders keyed by command name. Builders that register several
+# commands appear once per command they register.
+SUBCOMMAND_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "start": _build_time_parsers,
+    "stop": _build_time_parsers,
+    "resume": _build_time_parsers,
+    "pause": _build_time_parsers,
+    "skip": _build_time_parsers,
+    "complete": _build_time_parsers,
+    "info": _build_info_parser,
+    "client": _build_client_parser,
+    "project": _build_project_parser,
+    "task": _build_task_parser,
+    "project-task": _build_project_task_parser,
+    "switch": _build_switch_parser,
+    "events": _build_events_parser,
+    "tasks": _build_legacy_parsers,
+    "projects": _build_legacy_parsers,
+    "pomodoro": _build_pomodoro_parser,
+}
+
+
+@lru_cache(maxsize=1)
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Create argument parser with global options and command subparsers.
+
+    Args:
+        command: If this names a known command, only the subparsers for that
+                 command are built. Otherwise (help, unknown or missing command)
+                 every subparser is built so usage and errors list them all.
+
+    The parser is cached, so repeated calls within a process reuse it.
+    """
+    import argparse
+
+    class _FastParser(argparse.ArgumentParser):
+        """ArgumentParser reusing one formatter to validate added arguments.
+
+        add_argument() builds a throwaway HelpFormatter per call (and on
+        Python 3.14+ each one scans the environment for colour settings).
+        Help and usage output still get a fresh formatter.
+        """
+        _adding = False
+        _validation_formatter = None
+
+        def add_argument(self, *args, **kwargs):
+            self._adding = True
+            try:
+                return super().add_argument(*args, **kwargs)
+            finally:
+                self._adding = False
+
+        def _get_formatter(self):
+            if not self._adding:
+                return super()._get_formatter()
+            if self._validation_formatter is None:
+                self._validation_formatter = super()._get_formatter()
+            return self._validation_formatter
+
+    # Subparsers default to the parent's class, so they share the fast path
+    parser = _FastParser(
+        description="Clockify CLI - Time tracking and Pomodoro integration",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    # Global options
+    parser.add_argument("--token", help="Clockify API token")
+    parser.add_argument("--workspace-id", help="Workspace ID")
+    parser.add_argument("--project-id", help="Project ID")
+    parser.add_argument("--task-name", help="Task name (deprecated, use --description)")
+    parser.add_argument("--description", help="Time entry description")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Ignore cached workspace data and fetch it again")
+    
+    # Subcommands
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    builder = SUBCOMMAND_BUILDERS.get(command)
+    if builder:
+        builder(subparsers)
+    else:
+        # Build each subparser group once, in registration order
+        for builder in dict.fromkeys(SUBCOMMAND_BUILDERS.values()):
+            builder(subparsers)
     
     return parser
 
 
-def setup_components(args, load_data: bool = True) -> tuple:
+# create_parser()'s top-level help, printed for bare and -h/--help invocations
+# without building any parser. This is a hand-made copy of argparse's output,
+# and nothing checks the two against each other: whenever a command is added
+# to SUBCOMMAND_BUILDERS (or its help text changes in the _build_*_parser
+# functions above) or a global option changes in create_parser(), regenerate
+# it from `python -c "import app; app.create_parser().print_help()"`, with the
+# program name replaced by %(prog)s.
+_STATIC_HELP = """\
+usage: %(prog)s [-h] [--token TOKEN] [--workspace-id WORKSPACE_ID]
+              [--project-id PROJECT_ID] [--task-name TASK_NAME]
+              [--description DESCRIPTION] [--refresh-cache]
+              {start,stop,resume,pause,skip,complete,info,client,project,task,project-task,switch,events,tasks,projects,pomodoro}
+              ...
+
+Clockify CLI - Time tracking and Pomodoro integration
+
+positional arguments:
+  {start,stop,resume,pause,skip,complete,info,client,project,task,project-task,switch,events,tasks,projects,pomodoro}
+                        Available commands
+    start               Start time tracking
+    stop                Stop time tracking
+    resume              Resume time tracking
+    pause               Pause time tracking
+    skip                Skip current session
+    complete            Complete current session
+    info                Show current status
+    client              Client management
+    project             Project management
+    task                Task management
+    project-task        Select project and task (auto-updates client)
+    switch              Switch back to previous task (like 'cd -' or 'git
+                        checkout -')
+    events              Pomodoro event logging
+    tasks               List tasks (legacy alias)
+    projects            List projects (legacy alias)
+    pomodoro            Pomodoro timer control
+
+options:
+  -h, --help            show this help message and exit
+  --token TOKEN         Clockify API token
+  --workspace-id WORKSPACE_ID
+                        Workspace ID
+  --project-id PROJECT_ID
+                        Project ID
+  --task-name TASK_NAME
+                        Task name (deprecated, use --description)
+  --description DESCRIPTION
+                        Time entry description
+  --refresh-cache       Ignore cached workspace data and fetch it again
+"""
+
+
+# Internal command for a bare --description/--task-name invocation
+DESCRIPTION_COMMAND = "_change_description"
+
+# Hand-written grammar for the fixed command set, so normal invocations
+# never construct argparse. Each command maps to its sub-action dest (None if
+# it has no sub-actions) and, per sub-action (None when omitted), a leaf of
+# (required positionals, optional positionals, {option: (dest, type, default)}).
+# Options typed bool are flags.
+_NO_ARGS: tuple = ((), (), {})
+_NAME_ARG: tuple = (("name",), (), {})
+_HISTORY_LIMIT = ("limit", int, 50)
+
+_GRAMMAR: dict[str, tuple[str | None, dict[str | None, tuple]]] = {
+    "start": (None, {None: ((), ("enable",), {})}),
+    "skip": (None, {None: ((), ("disable",), {})}),
+    **dict.fromkeys(["stop", "resume", "pause", "complete", "info", "project-task",
+                     "switch", "tasks", "projects"], (None, {None: _NO_ARGS})),
+    "client": ("client_action", {None: _NO_ARGS, "list": _NO_ARGS,
+                                 "select": _NO_ARGS, "set": _NAME_ARG}),
+    "project": ("project_action", {None: _NO_ARGS, "list": _NO_ARGS,
+                                   "select": _NO_ARGS, "set": _NAME_ARG}),
+    "task": ("task_action", {
+        None: _NO_ARGS,
+        "list": ((), (), {"--limit": _HISTORY_LIMIT,
+                          "--all-projects": ("all_projects", bool, False)}),
+        "select": ((), (), {"--limit": _HISTORY_LIMIT}),
+        "set": _NAME_ARG,
+        "create": _NAME_ARG,
+        "delete": _NAME_ARG,
+    }),
+    "events": ("events_action", {
+        None: _NO_ARGS,
+        "extract": ((), (), {"--since": ("since", str, "1 day ago")}),
+        "list": ((), (), {"--limit": ("limit", int, None)}),
+        "clear": _NO_ARGS,
+    }),
+    "pomodoro": ("pomodoro_action", dict.fromkeys(
+        [None, "start", "stop", "pause", "resume", "skip", "status", "sync"], _NO_ARGS)),
+}
+
+# Global options, valid before the command
+_GLOBAL_OPTIONS: dict[str, str] = {
+    "--token": "token",
+    "--workspace-id": "workspace_id",
+    "--project-id": "project_id",
+    "--task-name": "task_name",
+    "--description": "description",
+}
+
+
+def _print_static_help() -> None:
+    """Print the top-level help without constructing argparse."""
+    print(_STATIC_HELP % {"prog": os.path.basename(sys.argv[0])}, end="")
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the command token, skipping global options and their values."""
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _GLOBAL_OPTIONS:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return token
+    return None
+
+
+def _parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse argv against _GRAMMAR without argparse.
+
+    Returns the same attributes argparse would set, or None for anything
+    outside the plain grammar (help, usage errors, --opt=value forms) so the
+    caller can fall back to argparse for its messages.
+    """
+    values: dict = dict.fromkeys(_GLOBAL_OPTIONS.values())
+    values["refresh_cache"] = False
+    tokens = iter(argv)
+
+    # Global options up to the command
+    for token in tokens:
+        if token == "--refresh-cache":
+            values["refresh_cache"] = True
+        elif token in _GLOBAL_OPTIONS:
+            value = next(tokens, None)
+            if value is None:
+                return None
+            values[_GLOBAL_OPTIONS[token]] = value
+        elif token.startswith("-"):
+            return None
+        else:
+            values["command"] = token
+            break
+    else:
+        values["command"] = None
+        return SimpleNamespace(**values)
+
+    grammar = _GRAMMAR.get(values["command"])
+    if grammar is None:
+        return None
+    action_dest, leaves = grammar
+    rest = list(tokens)
+
+    # Sub-action, if the command has them
+    action = None
+    if action_dest:
+        if rest and not rest[0].startswith("-"):
+            action = rest.pop(0)
+        if action not in leaves:
+            return None
+        values[action_dest] = action
+    required, optional, options = leaves[action]
+
+    for dest, _, default in options.values():
+        values[dest] = default
+    positionals = []
+    rest_iter = iter(rest)
+    for token in rest_iter:
+        if token in options:
+            dest, kind, _ = options[token]
+            if kind is bool:
+                values[dest] = True
+                continue
+            value = next(rest_iter, None)
+            if value is None:
+                return None
+            try:
+                values[dest] = kind(value)
+            except ValueError:
+                return None
+        elif token.startswith("-"):
+            return None
+        else:
+            positionals.append(token)
+
+    names = required + optional
+    if not len(required) <= len(positionals) <= len(names):
+        return None
+    values.update(dict.fromkeys(optional))
+    values.update(zip(names, positionals))
+    return SimpleNamespace(**values)
+
+
+# Cache resource groups each command reads, preloaded in one go at startup.
+# Anything a command needs beyond these is still fetched on demand.
+CACHE_REQUIREMENTS: dict[str, set[str]] = {
+    "start": set(),
+    "resume": set(),
+    "stop": set(),
+    "pause": set(),
+    "complete": set(),
+    "skip": set(),
+    "pomodoro": set(),
+    "info": {"projects"},
+    "switch": {"projects"},
+    "projects": {"projects"},
+    "client": {"clients"},
+    "project": {"projects", "clients"},
+    "task": {"projects", "tasks", "time_entries"},
+    "tasks": {"projects", "tasks", "time_entries"},
+    "project-task": {"projects", "clients", "tasks", "time_entries"},
+    DESCRIPTION_COMMAND: set(),
+}
+DEFAULT_CACHE_REQUIREMENTS: set[str] = {"projects", "clients", "tasks"}
+
+# Seconds for which workspace data cached on disk is reused
+CACHE_MAX_AGE = 300
+
+
+def _cache_file(workspace_id: str) -> Path:
+    """Path of the on-disk workspace data cache."""
+    from pathlib import Path
+
+    return Path.home() / ".cache" / "clockify" / f"cache-{workspace_id}.json"
+
+
+# Resource group a command is usually followed by a need for, keyed by
+# "command:action". It is fetched in the background after the command
+# succeeds and persisted, so the next invocation finds it in the disk cache.
+NEXT_PREDICTION: dict[str, str] = {
+    "client:select": "projects",
+    "client:set": "projects",
+    "project:select": "tasks",
+    "project:set": "tasks",
+}
+
+
+def _prefetch_next(args: argparse.Namespace, cache: DataCache) -> None:
+    """Start a daemon thread prefetching the resource predicted to be needed next.
+
+    If the process ends first the thread just stops; the disk cache is
+    replaced atomically, so it is never left half-written.
+    """
+    import threading
+
+    action_dest = _GRAMMAR.get(args.command, (None, None))[0]
+    action = (getattr(args, action_dest) or "select") if action_dest else None
+    resource = NEXT_PREDICTION.get(f"{args.command}:{action}")
+    if resource is None:
+        return
+
+    def prefetch() -> None:
+        try:
+            cache.prefetch(resource)
+        except Exception:
+            # Speculative work; the next run fetches on demand if this failed
+            pass
+
+    threading.Thread(target=prefetch, daemon=True).start()
+
+
+class Components:
+    """CLI components sharing one config, API client and data cache.
+
+    Managers and the time tracker are only constructed when a command first
+    uses them.
+    """
+
+    def __init__(self, config: ClockifyConfig, api: ClockifyAPI, cache: DataCache) -> None:
+        self.config = config
+        self.api = api
+        self.cache = cache
+
+    @cached_property
+    def client_manager(self) -> ClientManager:
+        from modules.client_manager import ClientManager
+        return ClientManager(self.api, self.config, self.cache)
+
+    @cached_property
+    def project_manager(self) -> ProjectManager:
+        from modules.project_manager import ProjectManager
+        return ProjectManager(self.api, self.config, self.cache)
+
+    @cached_property
+    def task_manager(self) -> TaskDescriptionManager:
+        from modules.task_manager_new import TaskDescriptionManager
+        return TaskDescriptionManager(self.api, self.config, self.project_manager, self.cache)
+
+    @cached_property
+    def time_tracker(self) -> TimeTracker:
+        from modules.time_tracker import TimeTracker
+        return TimeTracker(self.api, self.config, self.project_manager)
+
+
+def setup_components(args: argparse.Namespace, resources: set[str] | None = None) -> Components:
     """Initialize all components with configuration.
 
     Args:
         args: Command line arguments
-        load_data: If True, preload all workspace data. Set to False for simple
-                   start/stop commands to improve performance.
+        resources: Cache resource groups to preload. Defaults to the
+                   requirements of args.command (see CACHE_REQUIREMENTS).
     """
+    from modules.config import ClockifyConfig
+    from modules.api_client import ClockifyAPI, ClockifyAPIError
+    from modules.data_cache import DataCache
+
     # Load configuration
-    config = ClockifyConfig()
+    config = ClockifyConfig.get_shared()
 
     # Apply command line overrides
     if args.token:
@@ -155,10 +566,9 @@ def setup_components(args, load_data: bool = True) -> tuple:
         config.description = args.task_name
 
     # Check required configuration
-    missing = config.get_missing_config()
-    if missing:
+    if not (config.token and config.workspace_id):
         print("Error: Missing required configuration:")
-        for item in missing:
+        for item in config.get_missing_config():
             print(f"  - {item}")
         print("\nUse --token and --workspace-id options or configure them first.")
         sys.exit(1)
@@ -167,184 +577,239 @@ def setup_components(args, load_data: bool = True) -> tuple:
     try:
         api = ClockifyAPI(config.token, config.workspace_id)
 
-        # Initialize cache and optionally load all data at startup
-        cache = DataCache(api)
-        if load_data:
-            cache.load_all(time_entries_limit=100)
+        # Initialize cache and preload the data this command needs
+        if resources is None:
+            resources = CACHE_REQUIREMENTS.get(args.command, DEFAULT_CACHE_REQUIREMENTS)
+        # Reuse recently fetched data from earlier invocations
+        cache = DataCache(api, _cache_file(config.workspace_id), max_age=CACHE_MAX_AGE)
+        cache.load_all(time_entries_limit=100, resources=resources, force=args.refresh_cache)
 
-        client_manager = ClientManager(api, config, cache)
-        project_manager = ProjectManager(api, config, cache)
-        task_manager = TaskDescriptionManager(api, config, project_manager, cache)
-        time_tracker = TimeTracker(api, config, project_manager)
-
-        return config, api, client_manager, project_manager, task_manager, time_tracker
+        return Components(config, api, cache)
 
     except ClockifyAPIError as e:
         print(f"Error initializing Clockify API: {e}")
         sys.exit(1)
 
 
-def handle_time_commands(args, time_tracker: TimeTracker) -> None:
-    """Handle time tracking commands."""
-    # Debug: Log the command and pomodoro state
-    import sys
-    pomodoro = PomodoroIntegration()
+def _pomodoro() -> PomodoroIntegration:
+    """Return the process-wide Pomodoro integration."""
+    from modules.pomodoro import get_pomodoro
+    return get_pomodoro()
+
+
+def _start(args: argparse.Namespace, time_tracker: TimeTracker) -> int:
+    """Start (or resume) time tracking."""
+    success = time_tracker.start_tracking(args.task_name, args.project_id)
+    return 0 if success else 1
+
+
+def _stop(args: argparse.Namespace, time_tracker: TimeTracker) -> int:
+    """Stop (pause, complete) time tracking."""
+    success = time_tracker.stop_tracking()
+    return 0 if success else 1
+
+
+def _skip(args: argparse.Namespace, time_tracker: TimeTracker) -> int:
+    """Skip the Pomodoro session and stop time tracking."""
+    from modules.pomodoro import PomodoroError
+
+    # Handle Pomodoro skip
+    pomodoro = _pomodoro()
     if pomodoro.is_available():
-        current_state = pomodoro.get_current_state()
+        try:
+            pomodoro.skip()
+            print("Pomodoro session skipped")
+        except PomodoroError as e:
+            print(f"Error skipping Pomodoro: {e}")
+
+    return _stop(args, time_tracker)
+
+
+_TIME_HANDLERS: dict[str, TimeHandler] = {
+    "start": _start,
+    "resume": _start,
+    "stop": _stop,
+    "pause": _stop,
+    "complete": _stop,
+    "skip": _skip,
+}
+
+# Commands routed through handle_time_commands
+_TIME_CMDS = frozenset(_TIME_HANDLERS)
+_YES = frozenset({"y", "yes"})
+
+
+def handle_time_commands(args: argparse.Namespace, time_tracker: TimeTracker) -> int:
+    """Handle time tracking commands."""
+    # Debug: Log the command (parsed back from the journal by modules.events).
+    # Probing the Pomodoro state costs a D-Bus round-trip, so it is opt-in.
+    if _DEBUG:
+        pomodoro = _pomodoro()
+        current_state = pomodoro.get_current_state() if pomodoro.is_available() else None
         print(f"DEBUG: Command={args.command}, Pomodoro state={current_state}", file=sys.stderr)
+    else:
+        print(f"DEBUG: Command={args.command}", file=sys.stderr)
 
-    if args.command in ["start", "resume"]:
-        success = time_tracker.start_tracking(args.task_name, args.project_id)
-        if not success:
-            sys.exit(1)
+    return _TIME_HANDLERS[args.command](args, time_tracker)
 
-    elif args.command in ["stop", "pause", "complete"]:
-        success = time_tracker.stop_tracking()
-        if not success:
-            sys.exit(1)
-    
-    elif args.command == "skip":
-        # Handle Pomodoro skip
-        pomodoro = PomodoroIntegration()
-        if pomodoro.is_available():
-            try:
-                pomodoro.skip()
-                print("Pomodoro session skipped")
-            except PomodoroError as e:
-                print(f"Error skipping Pomodoro: {e}")
-        
-        success = time_tracker.stop_tracking()
-        if not success:
-            sys.exit(1)
+
+def _select_and_set(select: Callable[[], tuple | None], apply: Callable[..., object], label: str) -> int:
+    """Run an interactive selection and apply its result unless cancelled."""
+    result = select()
+    if not result:
+        print(f"{label} selection cancelled")
+        return 0
+    apply(*result)
+    return 0
+
+
+def _select_client(args: argparse.Namespace, client_manager: ClientManager) -> int:
+    """Interactively select the current client."""
+    return _select_and_set(
+        client_manager.select_client_interactive,
+        lambda client_id, client_name: client_manager.set_current_client(client_id),
+        "Client")
+
+
+def _set_client(args: argparse.Namespace, client_manager: ClientManager) -> int:
+    """Set the current client by name."""
+    success = client_manager.set_current_client_by_name(args.name)
+    return 0 if success else 1
 
 
-def handle_client_commands(args, client_manager: ClientManager) -> None:
+def _list_clients(args: argparse.Namespace, client_manager: ClientManager) -> int:
+    """List all clients."""
+    client_manager.list_clients()
+    return 0
+
+
+# Keyed by sub-action; None is the default when no sub-action is given
+_CLIENT_HANDLERS: dict[str | None, ClientHandler] = {
+    None: _select_client,
+    "list": _list_clients,
+    "select": _select_client,
+    "set": _set_client,
+}
+
+
+def handle_client_commands(args: argparse.Namespace, client_manager: ClientManager) -> int:
     """Handle client management commands."""
-    if not args.client_action:
-        # Default to interactive selection
-        result = client_manager.select_client_interactive()
-        if result:
-            client_id, client_name = result
-            client_manager.set_current_client(client_id)
-        else:
-            print("Client selection cancelled")
+    return _CLIENT_HANDLERS[args.client_action](args, client_manager)
 
-    elif args.client_action == "list":
-        client_manager.list_clients()
 
-    elif args.client_action == "select":
-        result = client_manager.select_client_interactive()
-        if result:
-            client_id, client_name = result
-            client_manager.set_current_client(client_id)
-        else:
-            print("Client selection cancelled")
+def _select_project(args: argparse.Namespace, project_manager: ProjectManager) -> int:
+    """Interactively select the current project."""
+    return _select_and_set(
+        project_manager.select_project_interactive,
+        lambda project_id, project_name: project_manager.set_current_project(project_id),
+        "Project")
+
 
-    elif args.client_action == "set":
-        success = client_manager.set_current_client_by_name(args.name)
-        if not success:
-            sys.exit(1)
+def _set_project(args: argparse.Namespace, project_manager: ProjectManager) -> int:
+    """Set the current project by name."""
+    success = project_manager.set_current_project_by_name(args.name)
+    return 0 if success else 1
 
 
-def handle_project_commands(args, project_manager: ProjectManager) -> None:
+def _list_projects(args: argparse.Namespace, project_manager: ProjectManager) -> int:
+    """List all projects."""
+    project_manager.list_projects()
+    return 0
+
+
+_PROJECT_HANDLERS: dict[str | None, ProjectHandler] = {
+    None: _select_project,
+    "list": _list_projects,
+    "select": _select_project,
+    "set": _set_project,
+}
+
+
+def handle_project_commands(args: argparse.Namespace, project_manager: ProjectManager) -> int:
     """Handle project management commands."""
-    if not args.project_action:
-        # Default to interactive selection
-        result = project_manager.select_project_interactive()
-        if result:
-            project_id, project_name = result
-            project_manager.set_current_project(project_id)
-        else:
-            print("Project selection cancelled")
-    
-    elif args.project_action == "list":
-        project_manager.list_projects()
-    
-    elif args.project_action == "select":
-        result = project_manager.select_project_interactive()
-        if result:
-            project_id, project_name = result
-            project_manager.set_current_project(project_id)
-        else:
-            print("Project selection cancelled")
-    
-    elif args.project_action == "set":
-        success = project_manager.set_current_project_by_name(args.name)
-        if not success:
-            sys.exit(1)
+    return _PROJECT_HANDLERS[args.project_action](args, project_manager)
+
+
+def _select_task(args: argparse.Namespace, task_manager: TaskDescriptionManager) -> int:
+    """Interactively select the current task and description."""
+    return _select_and_set(
+        task_manager.select_task_and_description_interactive,
+        task_manager.set_current_task_and_description,
+        "Task/description")
+
+
+def _set_task_description(args: argparse.Namespace, task_manager: TaskDescriptionManager) -> int:
+    """Set the description for the current task."""
+    # For backward compatibility - treat as description
+    current_task_id = task_manager.config.task_id
+    current_task_name = task_manager.config.task_name
+
+    if current_task_id and current_task_name:
+        task_manager.set_current_task_and_description(current_task_id, current_task_name, args.name)
+    else:
+        print("No current task set. Use 'task select' first.")
+    return 0
+
+
+def _list_tasks(args: argparse.Namespace, task_manager: TaskDescriptionManager) -> int:
+    """List formal tasks of the current project with their descriptions."""
+    task_manager.list_tasks_and_descriptions()
+    return 0
 
 
-def handle_task_commands(args, task_manager: TaskDescriptionManager) -> None:
+def _create_task(args: argparse.Namespace, task_manager: TaskDescriptionManager) -> int:
+    """Create a formal task in the current project."""
+    success = task_manager.create_formal_task(args.name)
+    return 0 if success else 1
+
+
+def _delete_task(args: argparse.Namespace, task_manager: TaskDescriptionManager) -> int:
+    """Delete a formal task from the current project."""
+    success = task_manager.delete_formal_task(args.name)
+    return 0 if success else 1
+
+
+_TASK_HANDLERS: dict[str | None, TaskHandler] = {
+    None: _select_task,
+    "list": _list_tasks,
+    "select": _select_task,
+    "set": _set_task_description,
+    "create": _create_task,
+    "delete": _delete_task,
+}
+
+
+def handle_task_commands(args: argparse.Namespace, task_manager: TaskDescriptionManager) -> int:
     """Handle task and description management commands."""
-    if not args.task_action:
-        # Default to interactive task and description selection
-        result = task_manager.select_task_and_description_interactive()
-        if result:
-            task_id, task_name, description = result
-            task_manager.set_current_task_and_description(task_id, task_name, description)
-        else:
-            print("Task/description selection cancelled")
-    
-    elif args.task_action == "list":
-        task_manager.list_tasks_and_descriptions()
-    
-    elif args.task_action == "select":
-        result = task_manager.select_task_and_description_interactive()
-        if result:
-            task_id, task_name, description = result
-            task_manager.set_current_task_and_description(task_id, task_name, description)
-        else:
-            print("Task/description selection cancelled")
-    
-    elif args.task_action == "set":
-        # For backward compatibility - treat as description
-        current_task_id = task_manager.config.task_id
-        current_task_name = task_manager.config.task_name
-        
-        if current_task_id and current_task_name:
-            task_manager.set_current_task_and_description(current_task_id, current_task_name, args.name)
-        else:
-            print("No current task set. Use 'task select' first.")
-    
-    elif args.task_action == "create":
-        success = task_manager.create_formal_task(args.name)
-        if not success:
-            sys.exit(1)
-    
-    elif args.task_action == "delete":
-        success = task_manager.delete_formal_task(args.name)
-        if not success:
-            sys.exit(1)
+    return _TASK_HANDLERS[args.task_action](args, task_manager)
 
 
-def handle_pomodoro_commands(args, time_tracker: TimeTracker) -> None:
+def handle_pomodoro_commands(args: argparse.Namespace, time_tracker: TimeTracker) -> int:
     """Handle Pomodoro timer commands."""
-    pomodoro = PomodoroIntegration()
+    from modules.pomodoro import PomodoroError
+
+    pomodoro = _pomodoro()
+    if args.pomodoro_action == "sync":
+        # Re-probe in case Gnome Pomodoro was started or stopped meanwhile
+        pomodoro.invalidate_availability()
 
     if not pomodoro.is_available():
         print("Pomodoro integration not available")
-        return
+        return 0
 
-    try:
-        if args.pomodoro_action == "start":
-            pomodoro.start()
-            print("Pomodoro started")
+    actions = {
+        "start": (pomodoro.start, "Pomodoro started"),
+        "stop": (pomodoro.stop, "Pomodoro stopped"),
+        "pause": (pomodoro.pause, "Pomodoro paused"),
+        "resume": (pomodoro.resume, "Pomodoro resumed"),
+        "skip": (pomodoro.skip, "Pomodoro session skipped"),
+    }
 
-        elif args.pomodoro_action == "stop":
-            pomodoro.stop()
-            print("Pomodoro stopped")
-
-        elif args.pomodoro_action == "pause":
-            pomodoro.pause()
-            print("Pomodoro paused")
-
-        elif args.pomodoro_action == "resume":
-            pomodoro.resume()
-            print("Pomodoro resumed")
-
-        elif args.pomodoro_action == "skip":
-            pomodoro.skip()
-            print("Pomodoro session skipped")
+    try:
+        if args.pomodoro_action in actions:
+            action, message = actions[args.pomodoro_action]
+            action()
+            print(message)
 
         elif args.pomodoro_action == "status":
             state = pomodoro.get_current_state()
@@ -355,78 +820,86 @@ def handle_pomodoro_commands(args, time_tracker: TimeTracker) -> None:
 
     except PomodoroError as e:
         print(f"Pomodoro error: {e}")
-        sys.exit(1)
+        return 1
+
+    return 0
+
+
+@lru_cache(maxsize=1)
+def _extractor() -> PomodoroEventExtractor:
+    """Return the process-wide journal event extractor."""
+    from modules.events import PomodoroEventExtractor
+    return PomodoroEventExtractor()
 
 
-def handle_events_commands(args) -> None:
+def handle_events_commands(args: argparse.Namespace) -> int:
     """Handle pomodoro event logging commands."""
-    extractor = PomodoroEventExtractor()
+    extractor = _extractor()
 
     if not args.events_action or args.events_action == "extract":
         # Extract events from journalctl
-        since = args.since if hasattr(args, 'since') else "1 day ago"
+        since = getattr(args, "since", "1 day ago")
         events = extractor.extract_events(since=since)
         extractor.save_to_file()
         print(f"Extracted and saved {len(events)} events from journalctl (since {since})")
 
     elif args.events_action == "list":
         # List saved events
-        limit = args.limit if hasattr(args, 'limit') else None
+        limit = getattr(args, "limit", None)
         events = extractor.get_saved_events(limit=limit)
 
         if not events:
             print("No saved events found")
-            return
-
-        print(f"\nPomodoro Events ({len(events)} total):")
-        print("=" * 80)
+            return 0
 
+        lines = [f"\nPomodoro Events ({len(events)} total):", "=" * 80]
         for event in events:
             event_type = event.get("event_type", "unknown")
             timestamp = event.get("timestamp", "")
             description = event.get("description", "")
 
             # Format output
-            print(f"{timestamp:20} {event_type:10}", end="")
-            if description:
-                print(f" {description}", end="")
-            print()
+            line = f"{timestamp:20} {event_type:10}"
+            lines.append(f"{line} {description}" if description else line)
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     elif args.events_action == "clear":
         # Clear all saved events
         extractor.clear_events()
         print("All saved events cleared")
 
+    return 0
+
 
 def handle_project_task_commands(project_manager: ProjectManager,
                                  task_manager: TaskDescriptionManager,
-                                 client_manager: ClientManager) -> None:
+                                 client_manager: ClientManager) -> int:
     """Handle combined project-task selection with automatic client update."""
-    from modules.utils import get_user_selection, display_markdown
-
     # Step 0: Display recent combinations as a markdown table
     recent_combinations = task_manager.get_recent_combinations(limit=5)
 
     if recent_combinations:
         # Build markdown table
-        markdown_table = "## Recent Description-Client-Task-Project Combinations\n\n"
-        markdown_table += "|#| Description | Client | Task | Project |\n"
-        markdown_table += "|-|-------------|--------|------|---------|\n"
-
+        lines = [
+            "## Recent Description-Client-Task-Project Combinations",
+            "",
+            "|#| Description | Client | Task | Project |",
+            "|-|-------------|--------|------|---------|",
+        ]
         for idx, combo in enumerate(recent_combinations, 1):
             client = combo['client_name'] if combo['client_name'] else "(no client)"
             project = combo['project_name']
             task = combo['task_name'] if combo['task_name'] else "(no task)"
             desc = combo['description']
 
-            markdown_table += f"| {idx} | {desc} | {client} | {task} | {project} |\n"
+            lines.append(f"| {idx} | {desc} | {client} | {task} | {project} |")
 
         # Display using bat if available
-        display_markdown(markdown_table)
-        print()
+        from modules.utils import display_markdown
+        display_markdown("\n".join(lines) + "\n")
 
         # Show current configuration
-        print("\nCurrent configuration:")
         current_client = "(not set)"
         current_project = "(not set)"
         current_task = "(not set)"
@@ -448,11 +921,16 @@ def handle_project_task_commands(project_manager: ProjectManager,
         if task_manager.config.description:
             current_description = task_manager.config.description
 
-        print(f"  Client: {current_client}")
-        print(f"  Project: {current_project}")
-        print(f"  Task: {current_task}")
-        print(f"  Description: {current_description}")
-        print()
+        sys.stdout.write("\n".join([
+            "",
+            "",
+            "Current configuration:",
+            f"  Client: {current_client}",
+            f"  Project: {current_project}",
+            f"  Task: {current_task}",
+            f"  Description: {current_description}",
+            "",
+        ]) + "\n")
 
         # Prompt user to select from recent or continue with manual selection
         while True:
@@ -480,12 +958,15 @@ def handle_project_task_commands(project_manager: ProjectManager,
                             combo['client_id']
                         )
 
-                        print(f"\nQuick selection applied:")
-                        print(f"  Client: {combo['client_name'] or '(none)'}")
-                        print(f"  Project: {combo['project_name']}")
-                        print(f"  Task: {combo['task_name'] or '(none)'}")
-                        print(f"  Description: {combo['description']}")
-                        return
+                        sys.stdout.write("\n".join([
+                            "",
+                            "Quick selection applied:",
+                            f"  Client: {combo['client_name'] or '(none)'}",
+                            f"  Project: {combo['project_name']}",
+                            f"  Task: {combo['task_name'] or '(none)'}",
+                            f"  Description: {combo['description']}",
+                        ]) + "\n")
+                        return 0
                     else:
                         print(f"Please enter a number between 1 and {len(recent_combinations)}, or press Enter for manual selection.")
                 except ValueError:
@@ -493,7 +974,7 @@ def handle_project_task_commands(project_manager: ProjectManager,
 
             except KeyboardInterrupt:
                 print("\nSelection cancelled")
-                return
+                return 0
 
     # Continue with normal project-task selection flow
     while True:
@@ -501,7 +982,7 @@ def handle_project_task_commands(project_manager: ProjectManager,
         result = project_manager.select_project_interactive()
         if not result:
             print("Project selection cancelled")
-            return
+            return 0
 
         project_id, project_name = result
 
@@ -526,7 +1007,7 @@ def handle_project_task_commands(project_manager: ProjectManager,
         result = task_manager.select_task_and_description_interactive()
         if not result:
             print("Task/description selection cancelled")
-            return
+            return 0
 
         task_id, task_name, description = result
 
@@ -539,107 +1020,194 @@ def handle_project_task_commands(project_manager: ProjectManager,
         task_manager.set_current_task_and_description(task_id, task_name, description)
         break  # Exit the loop
 
+    return 0
 
-def run_command(args, config, api, client_manager, project_manager, task_manager, time_tracker):
-    """Execute a single command."""
-    # Handle commands
-    if args.command in ["start", "resume", "stop", "pause", "complete", "skip"]:
-        handle_time_commands(args, time_tracker)
 
-    elif args.command == "info":
-        time_tracker.show_info()
+def _change_description(args: argparse.Namespace, ctx: Components) -> int:
+    """Change the description, restarting tracking if active."""
+    success = ctx.time_tracker.change_description(args.description or args.task_name)
+    return 0 if success else 1
 
-    elif args.command == "client":
-        handle_client_commands(args, client_manager)
 
-    elif args.command == "project":
-        handle_project_commands(args, project_manager)
+def _switch(args: argparse.Namespace, ctx: Components) -> int:
+    """Switch back to the previous task."""
+    success = ctx.task_manager.switch_to_previous_task()
+    return 0 if success else 1
 
-    elif args.command == "task":
-        handle_task_commands(args, task_manager)
 
-    elif args.command == "project-task":
-        handle_project_task_commands(project_manager, task_manager, client_manager)
+def _info(args: argparse.Namespace, ctx: Components) -> int:
+    """Show current status."""
+    ctx.time_tracker.show_info()
+    return 0
 
-    elif args.command == "switch":
-        success = task_manager.switch_to_previous_task()
-        if not success:
-            sys.exit(1)
 
-    elif args.command == "pomodoro":
-        handle_pomodoro_commands(args, time_tracker)
+def _project_task(args: argparse.Namespace, ctx: Components) -> int:
+    """Select project and task interactively."""
+    return handle_project_task_commands(ctx.project_manager, ctx.task_manager, ctx.client_manager)
 
-    elif args.command == "events":
-        handle_events_commands(args)
 
+def _events(args: argparse.Namespace, ctx: Components) -> int:
+    """Handle pomodoro event logging commands."""
+    return handle_events_commands(args)
+
+
+def _legacy_tasks(args: argparse.Namespace, ctx: Components) -> int:
+    """List tasks (legacy 'tasks' command)."""
+    ctx.task_manager.list_tasks()
+    return 0
+
+
+def _legacy_projects(args: argparse.Namespace, ctx: Components) -> int:
+    """List projects (legacy 'projects' command)."""
+    ctx.project_manager.list_projects()
+    return 0
+
+
+_COMMANDS: dict[str, CommandHandler] = {
+    **dict.fromkeys(_TIME_CMDS, lambda args, ctx: handle_time_commands(args, ctx.time_tracker)),
+    "info": _info,
+    "client": lambda args, ctx: handle_client_commands(args, ctx.client_manager),
+    "project": lambda args, ctx: handle_project_commands(args, ctx.project_manager),
+    "task": lambda args, ctx: handle_task_commands(args, ctx.task_manager),
+    "project-task": _project_task,
+    "switch": _switch,
+    "pomodoro": lambda args, ctx: handle_pomodoro_commands(args, ctx.time_tracker),
+    "events": _events,
+    DESCRIPTION_COMMAND: _change_description,
     # Legacy aliases
-    elif args.command == "tasks":
-        task_manager.list_tasks()
+    "tasks": _legacy_tasks,
+    "projects": _legacy_projects,
+}
 
-    elif args.command == "projects":
-        project_manager.list_projects()
 
-    else:
+def _cmd_project_task(ctx: Components) -> None:
+    """Select project and task interactively."""
+    handle_project_task_commands(ctx.project_manager, ctx.task_manager, ctx.client_manager)
+
+
+def _cmd_start(ctx: Components) -> None:
+    """Start tracking with the saved configuration."""
+    ctx.time_tracker.start_tracking()
+
+
+def _cmd_stop(ctx: Components) -> None:
+    """Stop tracking."""
+    ctx.time_tracker.stop_tracking()
+
+
+def _cmd_info(ctx: Components) -> None:
+    """Show current status."""
+    ctx.time_tracker.show_info()
+
+
+def _cmd_switch(ctx: Components) -> None:
+    """Switch back to the previous task."""
+    ctx.task_manager.switch_to_previous_task()
+
+
+# Commands accepted by the interactive loop in main()
+_INTERACTIVE_COMMANDS: dict[str, Callable[[Components], None]] = {
+    "project-task": _cmd_project_task,
+    "start": _cmd_start,
+    "resume": _cmd_start,
+    "stop": _cmd_stop,
+    "pause": _cmd_stop,
+    "complete": _cmd_stop,
+    "info": _cmd_info,
+    "switch": _cmd_switch,
+}
+
+
+def run_command(args: argparse.Namespace, ctx: Components) -> int:
+    """Execute a single command."""
+    handler = _COMMANDS.get(args.command)
+    if handler is None:
         print(f"Unknown command: {args.command}")
-        sys.exit(1)
+        return 1
+    return handler(args, ctx)
+
+
+# Multi-word trigger strings Gnome Pomodoro is known to send
+_TRIGGERS: dict[str, list[str]] = {
+    "start enable": ["start", "enable"],
+    "skip disable": ["skip", "disable"],
+}
+
 
+def _normalize_argv(argv: list[str]) -> list[str]:
+    """Expand Pomodoro triggers into separate arguments.
+
+    Gnome Pomodoro passes its triggers as a single argument with spaces,
+    e.g. "start enable" or "skip disable".
+    """
+    if len(argv) != 1:
+        return argv
+    trigger_parts = _TRIGGERS.get(argv[0])
+    if trigger_parts is None:
+        if ' ' not in argv[0]:
+            return argv
+        # Unlisted trigger combination
+        trigger_parts = argv[0].split()
+    if _DEBUG:
+        print(f"DEBUG: Parsed trigger parts={trigger_parts}", file=sys.stderr)
+    return list(trigger_parts)
 
-def main():
-    """Main application entry point."""
+
+def main() -> int:
+    """Main application entry point; returns the process exit code."""
     # Debug: Log raw command line arguments
-    import sys
     if len(sys.argv) > 1:
         print(f"DEBUG: Raw argv={sys.argv}", file=sys.stderr)
 
-    # Handle Pomodoro triggers - these come as single arguments with spaces
-    # e.g., "start enable", "skip disable"
-    if len(sys.argv) == 2 and ' ' in sys.argv[1]:
-        trigger_parts = sys.argv[1].split()
-        print(f"DEBUG: Parsed trigger parts={trigger_parts}", file=sys.stderr)
-        sys.argv = [sys.argv[0]] + trigger_parts
+    argv = _normalize_argv(sys.argv[1:])
 
-    parser = create_parser()
-    args = parser.parse_args()
+    if not argv or argv[0] in ("-h", "--help"):
+        _print_static_help()
+        return 0 if argv else 1
 
-    # Handle --description only (backward compatibility with --task-name)
-    description_arg = args.description or args.task_name
-    if (not args.command and description_arg and
-        ((len(sys.argv) == 3 and sys.argv[1] == "--description") or
-         (len(sys.argv) == 3 and sys.argv[1] == "--task-name"))):
-        try:
-            # Description change doesn't need full data loading
-            config, api, client_manager, project_manager, task_manager, time_tracker = setup_components(args, load_data=False)
-            time_tracker.change_description(description_arg)
-            return
-        except SystemExit:
-            return
+    args = _parse(argv)
+    if args is None:
+        # Help and usage errors are left to argparse; only build the
+        # subparser for the requested command
+        parser = create_parser(_peek_command(argv))
+        args = parser.parse_args(argv)
+
+    # A lone --description (or legacy --task-name) changes the description
+    if (not args.command and len(argv) == 2 and argv[0] in ("--description", "--task-name")
+            and (args.description or args.task_name)):
+        args.command = DESCRIPTION_COMMAND
 
     if not args.command:
-        parser.print_help()
-        sys.exit(1)
+        _print_static_help()
+        return 1
 
     # Handle events command without requiring Clockify setup
     if args.command == "events":
-        handle_events_commands(args)
-        return
-
-    # Determine if we need to load all workspace data
-    # Simple time tracking commands don't need the full data cache
-    simple_commands = ["start", "resume", "stop", "pause", "complete", "skip"]
-    needs_data = args.command not in simple_commands
+        return handle_events_commands(args)
 
-    # Setup components once (data loaded via HTTP only once if needed)
-    config, api, client_manager, project_manager, task_manager, time_tracker = setup_components(args, load_data=needs_data)
+    # Setup components once (only the data this command needs is preloaded)
+    ctx = setup_components(args)
 
     # Run the first command
-    run_command(args, config, api, client_manager, project_manager, task_manager, time_tracker)
+    code = run_command(args, ctx)
+    if code or args.command == DESCRIPTION_COMMAND:
+        return code
+
+    # Warm the disk cache for the command likely to follow this one
+    _prefetch_next(args, ctx.cache)
+
+    # Line editing and history for the prompts below, where available
+    try:
+        import readline
+    except ImportError:
+        pass
 
     # Loop to allow multiple commands without reloading data
     while True:
         try:
             print()
             continue_choice = input("Continue with another command? (y/n): ").strip().lower()
-            if continue_choice not in ['y', 'yes']:
+            if continue_choice not in _YES:
                 print("Exiting...")
                 break
 
@@ -649,20 +1217,12 @@ def main():
             if not command:
                 continue
 
-            # Create new args object with the command
-            if command == "project-task":
-                handle_project_task_commands(project_manager, task_manager, client_manager)
-            elif command in ["start", "resume"]:
-                time_tracker.start_tracking()
-            elif command in ["stop", "pause", "complete"]:
-                time_tracker.stop_tracking()
-            elif command == "info":
-                time_tracker.show_info()
-            elif command == "switch":
-                task_manager.switch_to_previous_task()
-            else:
+            handler = _INTERACTIVE_COMMANDS.get(command)
+            if handler is None:
                 print(f"Unknown command: {command}")
                 print("Available: project-task, start, stop, info, switch")
+            else:
+                handler(ctx)
 
         except KeyboardInterrupt:
             print("\n\nExiting...")
@@ -671,6 +1231,8 @@ def main():
             print("\nExiting...")
             break
 
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
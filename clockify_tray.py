@@ -8,6 +8,7 @@ gi.require_version('Gtk', '3.0')
 gi.require_version('AppIndicator3', '0.1')
 from gi.repository import Gtk, AppIndicator3, GLib
 import subprocess
+import fcntl
 import json
 import os
 import sys
@@ -24,6 +25,7 @@ from modules.api_client import ClockifyAPI, ClockifyAPIError
 from modules.client_manager import ClientManager
 from modules.project_manager import ProjectManager
 from modules.task_manager_new import TaskDescriptionManager
+from modules.time_tracker import TimeTracker
 
 
 class TaskSelectionDialog:
@@ -354,6 +356,7 @@ class ClockifyTray:
             self.client_manager = ClientManager(self.api, self.config)
             self.project_manager = ProjectManager(self.api, self.config)
             self.task_manager = TaskDescriptionManager(self.api, self.config, self.project_manager)
+            self.time_tracker = TimeTracker(self.api, self.config, self.project_manager)
         except Exception as e:
             print(f"Error loading Clockify configuration: {e}")
             sys.exit(1)
@@ -382,8 +385,15 @@ class ClockifyTray:
         self.elapsed_time = "00:00:00"
         self.is_tracking = False
         self.last_start_time = None
+        self._start_monotonic = 0.0  # time.monotonic() value at last_start_time
+        self._start_cache = {}  # raw start string of the running entry -> datetime
+        self._indicator_label = None  # label currently shown next to the icon
+        self._indicator_title = None  # tooltip currently set on the indicator
+        self._item_labels = {}  # id(menu item) -> label currently shown
         self.last_description = None
         self.error_count = 0
+        self._project_cache = {}  # project ID -> name
+        self._display_timer = None  # GLib source ID of the pending display update
 
         # Create menu
         self.menu = self.create_menu()
@@ -393,8 +403,7 @@ class ClockifyTray:
         self.update_from_api()
         GLib.timeout_add_seconds(30, self.update_from_api)
 
-        # Update display every second for live timer
-        GLib.timeout_add_seconds(1, self.update_display)
+        # The live timer display is armed by update_from_api() while tracking
 
     def create_menu(self):
         """Create the system tray menu."""
@@ -454,21 +463,51 @@ class ClockifyTray:
         menu.show_all()
         return menu
 
-    def update_display(self):
-        """Update the display every second (local calculation only)."""
-        # If we're tracking and have a start time, update the elapsed display
-        if self.last_start_time:
-            now = datetime.now(self.last_start_time.tzinfo)
-            elapsed = now - self.last_start_time
-
-            hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            self.elapsed_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    def schedule_display(self):
+        """Start the live timer display if tracking and not already running."""
+        if self._display_timer is None and self.last_start_time:
+            self._display_timer = GLib.timeout_add(0, self.update_display)
 
-            # Update label
-            self.indicator.set_label(f"{self.elapsed_time}", "")
-
-        return True  # Continue updating
+    def update_display(self):
+        """Update the elapsed time label (local calculation only).
+
+        Re-arms itself to fire when the seconds digit next rolls over, and
+        stops while not tracking instead of waking up every second.
+        """
+        self._display_timer = None
+        if not self.last_start_time:
+            return False
+
+        elapsed_ms = int((time.monotonic() - self._start_monotonic) * 1000)
+
+        hours, remainder = divmod(elapsed_ms // 1000, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        self.elapsed_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+        # Update label
+        self.set_indicator_label(self.elapsed_time)
+
+        delay_ms = 1000 - elapsed_ms % 1000
+        self._display_timer = GLib.timeout_add(delay_ms, self.update_display)
+        return False
+
+    def set_indicator_label(self, label):
+        """Set the label next to the tray icon, skipping no-op updates."""
+        if label != self._indicator_label:
+            self.indicator.set_label(label, "")
+            self._indicator_label = label
+
+    def set_indicator_title(self, title):
+        """Set the indicator tooltip, skipping no-op updates."""
+        if title != self._indicator_title:
+            self.indicator.set_title(title)
+            self._indicator_title = title
+
+    def set_item_label(self, item, label):
+        """Set a menu item's label, skipping no-op updates."""
+        if self._item_labels.get(id(item)) != label:
+            item.set_label(label)
+            self._item_labels[id(item)] = label
 
     def update_from_api(self):
         """Fetch current state from Clockify API."""
@@ -482,37 +521,45 @@ class ClockifyTray:
             if self.current_entry:
                 self.is_tracking = True
 
-                # Cache start time for live updates
-                start_time = datetime.fromisoformat(
-                    self.current_entry['timeInterval']['start'].replace('Z', '+00:00')
-                )
+                # Cache start time for live updates; it only changes when a
+                # new entry starts, so parse it once per entry
+                raw_start = self.current_entry['timeInterval']['start']
+                start_time = self._start_cache.get(raw_start)
+                if start_time is None:
+                    start_time = datetime.fromisoformat(raw_start.replace('Z', '+00:00'))
+                    self._start_cache = {raw_start: start_time}
                 self.last_start_time = start_time
+                # Re-anchor the live display to the monotonic clock each
+                # fetch, which also corrects for time spent suspended
+                elapsed = (datetime.now(start_time.tzinfo) - start_time).total_seconds()
+                self._start_monotonic = time.monotonic() - elapsed
+                self.schedule_display()
 
                 # Get and cache description
                 description = self.current_entry.get('description', 'No description')
                 self.last_description = description
 
                 # Update tooltip
-                self.indicator.set_title(f"Clockify: {description}")
+                self.set_indicator_title(f"Clockify: {description}")
 
                 # Update menu items
-                self.status_item.set_label(f"Tracking: {description}")
-                self.toggle_item.set_label("⏸ Stop Timer")
+                self.set_item_label(self.status_item, f"Tracking: {description}")
+                self.set_item_label(self.toggle_item, "⏸ Stop Timer")
 
                 # Update project info
                 project_name = self.get_project_name(self.current_entry.get('projectId'))
                 if project_name:
-                    self.project_item.set_label(f"Project: {project_name}")
+                    self.set_item_label(self.project_item, f"Project: {project_name}")
                 else:
-                    self.project_item.set_label("No project")
+                    self.set_item_label(self.project_item, "No project")
 
                 # Update task info
                 task_id = self.current_entry.get('taskId')
                 if task_id:
                     task_name = self.config.task_name or "Unknown task"
-                    self.task_item.set_label(f"Task: {task_name}")
+                    self.set_item_label(self.task_item, f"Task: {task_name}")
                 else:
-                    self.task_item.set_label("No task")
+                    self.set_item_label(self.task_item, "No task")
 
             else:
                 self.is_tracking = False
@@ -520,24 +567,24 @@ class ClockifyTray:
                 self.last_start_time = None
 
                 # Update label and clear tooltip
-                self.indicator.set_label("--:--:--", "")
-                self.indicator.set_title("Clockify: Not tracking")
+                self.set_indicator_label("--:--:--")
+                self.set_indicator_title("Clockify: Not tracking")
 
                 # Update menu items
-                self.status_item.set_label("Not tracking")
-                self.toggle_item.set_label("▶ Start Timer")
+                self.set_item_label(self.status_item, "Not tracking")
+                self.set_item_label(self.toggle_item, "▶ Start Timer")
 
                 # Show current project/task from config
                 if self.config.project_id:
                     project_name = self.get_project_name(self.config.project_id)
-                    self.project_item.set_label(f"Project: {project_name or 'Unknown'}")
+                    self.set_item_label(self.project_item, f"Project: {project_name or 'Unknown'}")
                 else:
-                    self.project_item.set_label("No project selected")
+                    self.set_item_label(self.project_item, "No project selected")
 
                 if self.config.description:
-                    self.task_item.set_label(f"Task: {self.config.description}")
+                    self.set_item_label(self.task_item, f"Task: {self.config.description}")
                 else:
-                    self.task_item.set_label("No task selected")
+                    self.set_item_label(self.task_item, "No task selected")
 
         except Exception as e:
             # Network error - use cached state if available
@@ -550,45 +597,42 @@ class ClockifyTray:
             # If we were tracking, update status to show offline
             # (timer continues via update_display())
             if self.last_start_time:
-                self.status_item.set_label(f"Tracking: {self.last_description or 'Unknown'} (offline)")
+                self.set_item_label(self.status_item, f"Tracking: {self.last_description or 'Unknown'} (offline)")
             else:
                 # No cached state, show offline
-                self.status_item.set_label("Offline - check network")
+                self.set_item_label(self.status_item, "Offline - check network")
 
         # Continue updating
         return True
 
     def get_project_name(self, project_id):
-        """Get project name from ID."""
+        """Get project name from ID, refetching projects only on a cache miss."""
         if not project_id:
             return None
 
-        try:
-            projects = self.api.get_projects()
-            for project in projects:
-                if project['id'] == project_id:
-                    return project['name']
-        except:
-            pass
+        if project_id not in self._project_cache:
+            try:
+                projects = self.api.get_projects()
+                self._project_cache = {project['id']: project['name'] for project in projects}
+            except ClockifyAPIError:
+                # Offline - keep whatever names are already cached
+                pass
 
-        return None
+        return self._project_cache.get(project_id)
 
     def toggle_timer(self, widget):
         """Start or stop the timer."""
         try:
-            app_path = SCRIPT_DIR / "app.py"
+            # Pick up project/task changes made from the command line
+            self.config.reload_if_changed()
 
             if self.is_tracking:
-                # Stop timer
-                subprocess.run(["/bin/python", str(app_path), "stop"],
-                             capture_output=True, text=True)
+                self.time_tracker.stop_tracking()
             else:
-                # Start timer
-                subprocess.run(["/bin/python", str(app_path), "start"],
-                             capture_output=True, text=True)
+                self.time_tracker.start_tracking()
 
-            # Update from API immediately after toggling
-            GLib.timeout_add(500, self.update_from_api)
+            # The request has completed, so refresh right away
+            self.update_from_api()
 
         except Exception as e:
             print(f"Error toggling timer: {e}")
@@ -616,16 +660,20 @@ class ClockifyTray:
             result = dialog.run()
 
             if result:
-                # Update all config values
-                self.config.client_id = result['client_id']
-                self.config.project_id = result['project_id']
-                self.config.task_id = result['task_id']
-                self.config.task_name = result['task_name']
-                self.config.description = result['description']
+                # Update all config values in a single write
+                with self.config.batch():
+                    self.config.client_id = result['client_id']
+                    self.config.project_id = result['project_id']
+                    self.config.task_id = result['task_id']
+                    self.config.task_name = result['task_name']
+                    self.config.description = result['description']
 
                 print(f"Task set to: {result['task_name']}")
                 print(f"Description set to: {result['description']}")
 
+                # Projects may have changed while the dialog was open
+                self.api.invalidate_projects()
+
                 # Refresh display
                 GLib.timeout_add(100, self.update_from_api)
 
@@ -635,40 +683,24 @@ class ClockifyTray:
 
 def main():
     """Main entry point."""
-    # Check if already running
+    # Check if already running; the kernel drops the lock when we exit
     lock_file = Path.home() / ".config" / "clockify" / "tray.lock"
     lock_file.parent.mkdir(parents=True, exist_ok=True)
 
-    if lock_file.exists():
-        try:
-            with open(lock_file) as f:
-                pid = int(f.read().strip())
-
-            # Check if process is still running
-            try:
-                os.kill(pid, 0)
-                print("Clockify tray is already running")
-                sys.exit(1)
-            except OSError:
-                # Process not running, remove stale lock file
-                lock_file.unlink()
-        except:
-            pass
-
-    # Create lock file
-    with open(lock_file, 'w') as f:
-        f.write(str(os.getpid()))
-
+    lock_fd = os.open(lock_file, os.O_CREAT | os.O_WRONLY, 0o644)
     try:
-        # Start the tray application
-        app = ClockifyTray()
-        Gtk.main()
-    finally:
-        # Clean up lock file
-        try:
-            lock_file.unlink()
-        except:
-            pass
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        print("Clockify tray is already running")
+        sys.exit(1)
+
+    # Record our PID for humans; the lock itself is what matters
+    os.ftruncate(lock_fd, 0)
+    os.write(lock_fd, str(os.getpid()).encode())
+
+    # Start the tray application
+    app = ClockifyTray()
+    Gtk.main()
 
 
 if __name__ == "__main__":
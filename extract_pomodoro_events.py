@@ -7,10 +7,39 @@ import subprocess
 import json
 import re
 import os
+import sys
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, List, Dict, Any, Optional
 import argparse
 
+from modules.utils import json_dumps, write_atomic
+
+# Fields extracted from gnome-pomodoro journal messages
+_CMD_RE = re.compile(r"Command=(\w+)")
+_START_RE = re.compile(r"Starting time entry:\s+(.+?)(?:\s+\(Task:.+\))?$")
+_DESCRIPTION_RE = re.compile(r"description:\s+(.+)$")
+_PROJECT_RE = re.compile(r"projectId:\s+(\S+)$")
+_TASK_RE = re.compile(r"taskId:\s+(\S+)$")
+_ENTRY_ID_RE = re.compile(r"ID:\s+(\S+)\)")
+
+# Marks the start of a new app.py invocation
+_RAW_ARGV_MARKER = "DEBUG: Raw argv="
+
+# (marker, pattern, field) for lines that fill in the current event; the
+# first marker found in a message decides how it is parsed
+_FIELD_MARKERS = (
+    ("DEBUG: Command=", _CMD_RE, "event_type"),
+    ("Starting time entry:", _START_RE, "description"),
+    ("description:", _DESCRIPTION_RE, "description"),
+    ("projectId:", _PROJECT_RE, "project_id"),
+    ("taskId:", _TASK_RE, "task_id"),
+    ("Time entry started successfully", _ENTRY_ID_RE, "entry_id"),
+    ("Time entry stopped successfully", _ENTRY_ID_RE, "entry_id"),
+)
+
 
 class PomodoroEventExtractor:
     """Extracts pomodoro events from system journal."""
@@ -28,108 +57,80 @@ class PomodoroEventExtractor:
         Returns:
             List of event dictionaries
         """
+        # Let journalctl filter to gnome-pomodoro and emit one JSON record per line
         cmd = [
             "journalctl",
             "--user",
+            "--identifier=gnome-pomodoro",
             "--since", since,
-            "--output=short-iso"
+            "--output=json",
+            "--no-pager"
         ]
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            self._parse_journal(result.stdout)
-            return self.events
-        except subprocess.CalledProcessError as e:
-            print(f"Error running journalctl: {e}", file=sys.stderr)
+        # Parse while journalctl is still writing instead of buffering it all
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                              text=True, bufsize=1) as proc:
+            self._parse_journal(proc.stdout)
+
+        if proc.returncode:
+            print(f"Error running journalctl: exit status {proc.returncode}", file=sys.stderr)
             return []
+        return self.events
 
-    def _parse_journal(self, journal_output: str) -> None:
-        """Parse journal output and extract pomodoro events."""
-        lines = journal_output.split('\n')
-        current_timestamp = None
+    def _parse_journal(self, journal_lines: Iterable[str]) -> None:
+        """Parse journalctl JSON output lines and extract pomodoro events."""
         current_event = {}
+        # Bind hot lookups to locals once for the per-line loop
+        loads = json.loads
+        fromtimestamp = datetime.fromtimestamp
+        add_event = self._add_event
 
-        for line in lines:
-            # Skip empty lines
-            if not line.strip():
-                continue
-
-            # Match timestamp and process lines
-            timestamp_match = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2})\s+\S+\s+gnome-pomodoro\[\d+\]:\s+(.+)$', line)
-            if not timestamp_match:
-                continue
-
-            timestamp_str = timestamp_match.group(1)
-            message = timestamp_match.group(2)
-
-            # Parse timestamp
+        for line in journal_lines:
             try:
-                # Parse ISO format with timezone
-                timestamp = datetime.fromisoformat(timestamp_str)
-                # Convert to naive datetime (remove timezone)
-                timestamp = timestamp.replace(tzinfo=None)
+                record = loads(line)
             except ValueError:
                 continue
 
+            message = record.get("MESSAGE")
+            # Non-UTF-8 messages are encoded as byte arrays; they're not ours
+            if not isinstance(message, str):
+                continue
+
             # Check for command execution (DEBUG: Raw argv=...)
-            if "DEBUG: Raw argv=" in message:
+            if _RAW_ARGV_MARKER in message:
+                try:
+                    # Microseconds since the epoch; events keep whole-second local time
+                    timestamp = fromtimestamp(int(record["__REALTIME_TIMESTAMP"]) // 1_000_000)
+                except (ValueError, KeyError):
+                    continue
+
                 # Save previous event if it exists
                 if current_event:
-                    self._add_event(current_event)
+                    add_event(current_event)
 
-                # Start new event
+                # Start new event; whole seconds, so isoformat() is
+                # always YYYY-MM-DDTHH:MM:SS and can be sliced
+                ts_iso = timestamp.isoformat()
                 current_event = {
-                    "timestamp": timestamp.isoformat(),
-                    "date": timestamp.strftime("%Y-%m-%d"),
-                    "time": timestamp.strftime("%H:%M:%S"),
+                    "timestamp": ts_iso,
+                    "date": ts_iso[:10],
+                    "time": ts_iso[11:19],
                 }
-                current_timestamp = timestamp
-
-            # Extract command type
-            elif "DEBUG: Command=" in message and current_event:
-                cmd_match = re.search(r"Command=(\w+)", message)
-                if cmd_match:
-                    current_event["event_type"] = cmd_match.group(1)
-
-            # Extract description
-            elif message.startswith("Starting time entry:") and current_event:
-                desc_match = re.search(r"Starting time entry:\s+(.+?)(?:\s+\(Task:.+\))?$", message)
-                if desc_match:
-                    current_event["description"] = desc_match.group(1).strip()
-
-            # Extract description detail
-            elif "description:" in message and current_event:
-                desc_match = re.search(r"description:\s+(.+)$", message)
-                if desc_match:
-                    current_event["description"] = desc_match.group(1).strip()
-
-            # Extract project ID
-            elif "projectId:" in message and current_event:
-                proj_match = re.search(r"projectId:\s+(\S+)$", message)
-                if proj_match:
-                    current_event["project_id"] = proj_match.group(1).strip()
-
-            # Extract task ID
-            elif "taskId:" in message and current_event:
-                task_match = re.search(r"taskId:\s+(\S+)$", message)
-                if task_match:
-                    current_event["task_id"] = task_match.group(1).strip()
-
-            # Extract entry ID
-            elif "Time entry started successfully" in message and current_event:
-                entry_match = re.search(r"ID:\s+(\S+)\)", message)
-                if entry_match:
-                    current_event["entry_id"] = entry_match.group(1).strip()
-
-            # Extract stopped entry ID
-            elif "Time entry stopped successfully" in message and current_event:
-                entry_match = re.search(r"ID:\s+(\S+)\)", message)
-                if entry_match:
-                    current_event["entry_id"] = entry_match.group(1).strip()
+                continue
+
+            if not current_event:
+                continue
+
+            for marker, pattern, field in _FIELD_MARKERS:
+                if marker in message:
+                    match = pattern.search(message)
+                    if match:
+                        current_event[field] = match.group(1).strip()
+                    break
 
         # Add final event
         if current_event:
-            self._add_event(current_event)
+            add_event(current_event)
 
     def _add_event(self, event: Dict[str, Any]) -> None:
         """Add event to list if it has required fields."""
@@ -153,23 +154,18 @@ class PomodoroEventExtractor:
             except (json.JSONDecodeError, IOError):
                 existing_events = []
 
-            # Merge events and deduplicate by timestamp
-            all_events = existing_events + self.events
-            seen_timestamps = set()
-            unique_events = []
-
-            for event in all_events:
+            # Merge events and deduplicate by timestamp; the first seen wins,
+            # so saved events take precedence over newly extracted ones
+            by_timestamp = {}
+            for event in chain(existing_events, self.events):
                 timestamp = event.get("timestamp")
-                if timestamp and timestamp not in seen_timestamps:
-                    seen_timestamps.add(timestamp)
-                    unique_events.append(event)
+                if timestamp:
+                    by_timestamp.setdefault(timestamp, event)
 
             # Sort by timestamp
-            unique_events.sort(key=lambda e: e.get("timestamp", ""))
-            events_to_save = unique_events
+            events_to_save = sorted(by_timestamp.values(), key=itemgetter("timestamp"))
 
-        with open(filename, 'w') as f:
-            json.dump(events_to_save, f, indent=2)
+        write_atomic(filename, json_dumps(events_to_save, indent=True))
 
 
 def main():
@@ -200,19 +196,16 @@ def main():
 
     if args.pretty:
         print(json.dumps(events, indent=2))
-    elif args.output:
-        extractor.save_to_file(args.output)
-        print(f"Saved {len(events)} events to {args.output}")
     else:
         # Default: save to ~/.config/clockify/events.json
-        import os
-        config_dir = os.path.expanduser("~/.config/clockify")
-        os.makedirs(config_dir, exist_ok=True)
-        output_file = os.path.join(config_dir, "events.json")
-        extractor.save_to_file(output_file)
+        if args.output:
+            output_file = Path(args.output)
+        else:
+            output_file = Path.home() / ".config" / "clockify" / "events.json"
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+        extractor.save_to_file(str(output_file))
         print(f"Saved {len(events)} events to {output_file}")
 
 
 if __name__ == "__main__":
-    import sys
     main()
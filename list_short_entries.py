@@ -8,11 +8,17 @@ Usage:
   ./list_short_entries.py --delete -y  # Delete without confirmation
 """
 import argparse
+import re
 from datetime import datetime
+from functools import lru_cache
 from modules.config import ClockifyConfig
 from modules.api_client import ClockifyAPI, ClockifyAPIError
 
+# ISO 8601 durations the API reports for entries under 10 seconds
+_SHORT_DURATION_RE = re.compile(r'^PT([0-9])S$')
 
+
+@lru_cache(maxsize=1024)
 def parse_iso_datetime(iso_string):
     """Parse ISO 8601 datetime string."""
     if iso_string.endswith('Z'):
@@ -47,6 +53,12 @@ def get_short_entries(api, limit=200):
         end = time_interval.get('end')
 
         if start and end:
+            # The API's own duration field (absent on some entries) rules out
+            # long entries without parsing timestamps; the exact duration
+            # shown for short ones still comes from start and end
+            duration_str = time_interval.get('duration')
+            if duration_str and not _SHORT_DURATION_RE.match(duration_str):
+                continue
             duration = calculate_duration_seconds(start, end)
             if duration is not None and duration < 10:
                 short_entries.append({
@@ -100,17 +112,14 @@ def delete_short_entries(api, short_entries, skip_confirm=False):
     deleted = 0
     failed = 0
 
-    for entry in short_entries:
-        try:
-            if api.delete_time_entry(entry['id']):
-                deleted += 1
-                print(f"✓ Deleted: {entry['description'][:50]} ({entry['duration']:.2f}s)")
-            else:
-                failed += 1
-                print(f"✗ Failed to delete: {entry['description'][:50]}")
-        except ClockifyAPIError as e:
+    results = api.delete_time_entries([entry['id'] for entry in short_entries])
+    for entry, success in zip(short_entries, results):
+        if success:
+            deleted += 1
+            print(f"✓ Deleted: {entry['description'][:50]} ({entry['duration']:.2f}s)")
+        else:
             failed += 1
-            print(f"✗ Error deleting {entry['description'][:50]}: {e}")
+            print(f"✗ Failed to delete: {entry['description'][:50]}")
 
     print(f"\nDeleted: {deleted}, Failed: {failed}")
 
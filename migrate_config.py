@@ -2,42 +2,48 @@
 """
 Migration script to convert bash clockifyrc to Python JSON format.
 """
-import os
-import json
 import shlex
+import shutil
 from pathlib import Path
+from typing import Optional
 
+from modules.utils import json_dumps, write_atomic
 
-def parse_bash_config(config_file: Path) -> dict:
-    """Parse bash-style configuration file."""
+
+def parse_bash_config(config_file: Path) -> Optional[dict]:
+    """Parse bash-style configuration file; None if it doesn't exist."""
+    try:
+        with open(config_file, 'r') as f:
+            return _parse_bash_lines(f)
+    except FileNotFoundError:
+        return None
+
+
+def _parse_bash_lines(lines) -> dict:
+    """Parse the lines of a bash-style configuration file."""
     config = {}
-    
-    if not config_file.exists():
-        print(f"Config file not found: {config_file}")
-        return config
-    
-    with open(config_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            if '=' in line:
-                key, value = line.split('=', 1)
-                # Remove quotes if present
-                value = shlex.split(value)[0] if value else ""
-                
-                # Map bash variable names to Python config keys
-                key_mapping = {
-                    'CLOCKIFY_TOKEN': 'token',
-                    'CLOCKIFY_WORKSPACE_ID': 'workspace_id', 
-                    'CLOCKIFY_PROJECT_ID': 'project_id',
-                    'CLOCKIFY_TASK_NAME': 'task_name'
-                }
-                
-                python_key = key_mapping.get(key, key.lower())
-                config[python_key] = value
-    
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        if '=' in line:
+            key, value = line.split('=', 1)
+            # Remove quotes if present
+            value = shlex.split(value)[0] if value else ""
+
+            # Map bash variable names to Python config keys
+            key_mapping = {
+                'CLOCKIFY_TOKEN': 'token',
+                'CLOCKIFY_WORKSPACE_ID': 'workspace_id', 
+                'CLOCKIFY_PROJECT_ID': 'project_id',
+                'CLOCKIFY_TASK_NAME': 'task_name'
+            }
+
+            python_key = key_mapping.get(key, key.lower())
+            config[python_key] = value
+
     return config
 
 
@@ -53,13 +59,11 @@ def migrate_config():
     print(f"Source: {old_config_file}")
     print(f"Target: {new_config_file}")
     
-    # Check if old config exists
-    if not old_config_file.exists():
-        print("No existing bash configuration found.")
-        return
-    
     # Parse the bash config
     config = parse_bash_config(old_config_file)
+    if config is None:
+        print("No existing bash configuration found.")
+        return
     
     if not config:
         print("No configuration data found to migrate.")
@@ -84,21 +88,20 @@ def migrate_config():
             return
     
     # Write new JSON config
-    with open(new_config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    write_atomic(new_config_file, json_dumps(config, indent=True))
     
     print(f"\nConfiguration migrated successfully to: {new_config_file}")
     
-    # Create backup of old config
-    if backup_file.exists():
+    # Create backup of old config, never overwriting an existing one
+    try:
+        with open(old_config_file, 'rb') as src, open(backup_file, 'xb') as dst:
+            shutil.copyfileobj(src, dst)
+        shutil.copystat(old_config_file, backup_file)
+        print(f"Backup created: {backup_file}")
+    except FileExistsError:
         print(f"Backup already exists: {backup_file}")
-    else:
-        try:
-            import shutil
-            shutil.copy2(old_config_file, backup_file)
-            print(f"Backup created: {backup_file}")
-        except Exception as e:
-            print(f"Warning: Could not create backup: {e}")
+    except Exception as e:
+        print(f"Warning: Could not create backup: {e}")
     
     print("\nMigration complete! You can now use the Python version:")
     print("  ./app.py info")
@@ -1,9 +1,14 @@
 """
 Core Clockify API client for making HTTP requests to the Clockify API.
 """
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Optional, Dict, List, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Iterable, Iterator, List, Any, Tuple
 from datetime import datetime
+from .utils import index_by_name, json_loads
 
 
 class ClockifyAPIError(Exception):
@@ -13,67 +18,133 @@ class ClockifyAPIError(Exception):
 
 class ClockifyAPI:
     """Core API client for Clockify interactions."""
-    
-    def __init__(self, token: str, workspace_id: str):
+
+    # Seconds a fetched project list is reused before hitting the API again
+    PROJECTS_TTL = 300
+
+    def __init__(self, token: str, workspace_id: str) -> None:
         self.token = token
         self.workspace_id = workspace_id
         self.base_url = "https://api.clockify.me/api/v1"
+        # Every workspace endpoint hangs off this URL; build it once
+        self._ws_root = f"{self.base_url}/workspaces/{workspace_id}"
         self.headers = {
             "X-Api-Key": token,
             "Content-Type": "application/json"
         }
-    
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Any:
-        """Make HTTP request to Clockify API."""
-        url = f"{self.base_url}/{endpoint}"
+        # Reuse TCP/TLS connections across requests (and warm-up threads).
+        # Retry covers transient connection failures, rate limiting and
+        # server errors; by default urllib3 only retries idempotent methods,
+        # so POST/PATCH are never replayed.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self._projects_cache: Optional[List[Dict[str, Any]]] = None
+        self._projects_cache_time = 0.0
+        self._projects_by_name: Dict[str, Dict[str, Any]] = {}
+        self._user_id: Optional[str] = None
+        # URL -> (ETag, parsed body) of the last conditional GET
+        self._etags: Dict[str, Tuple[str, Any]] = {}
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.session.close()
+
+    def get_validators(self) -> Dict[str, Tuple[str, Any]]:
+        """Return the ETag and body of each conditional GET so far, for persisting."""
+        return dict(self._etags)
+
+    def seed_validators(self, validators: Dict[str, Any]) -> None:
+        """Reuse ETags and bodies saved from an earlier get_validators()."""
+        for url, (etag, body) in validators.items():
+            self._etags.setdefault(url, (etag, body))
+
+    def _make_request(self, method: str, url: str, data: Optional[Dict] = None,
+                      conditional: bool = False) -> Any:
+        """Make HTTP request to a Clockify API URL.
+
+        With conditional=True, a GET replays the ETag of the previous response
+        for the URL and reuses its body on 304 Not Modified.
+        """
+        cached = self._etags.get(url) if conditional else None
+        headers = {"If-None-Match": cached[0]} if cached else None
 
         try:
-            response = requests.request(method, url, headers=self.headers, json=data)
+            response = self.session.request(method, url, json=data, headers=headers)
             response.raise_for_status()
 
+            if cached and response.status_code == 304:
+                return cached[1]
+
             # DELETE requests often return empty content
             if response.status_code == 204 or not response.content:
                 return None
 
-            return response.json()
+            result = json_loads(response.content)
+            etag = response.headers.get("ETag") if conditional else None
+            if etag:
+                self._etags[url] = (etag, result)
+            return result
         except requests.exceptions.RequestException as e:
             raise ClockifyAPIError(f"API request failed: {e}")
+        except ValueError as e:
+            raise ClockifyAPIError(f"API returned invalid JSON: {e}")
     
     def get_user(self) -> Dict[str, Any]:
         """Get current user information."""
-        return self._make_request("GET", "user")
+        return self._make_request("GET", f"{self.base_url}/user")
     
     def get_user_id(self) -> str:
-        """Get current user ID."""
-        user = self.get_user()
-        return user["id"]
+        """Get current user ID, fetching it only once per client."""
+        if self._user_id is None:
+            self._user_id = self.get_user()["id"]
+        return self._user_id
+
+    def set_user_id(self, user_id: str) -> None:
+        """Reuse a user ID fetched earlier, e.g. one saved in a cache file."""
+        self._user_id = user_id
     
     def get_workspaces(self) -> List[Dict[str, Any]]:
         """Get all workspaces."""
-        return self._make_request("GET", "workspaces")
+        return self._make_request("GET", f"{self.base_url}/workspaces")
     
     def get_clients(self) -> List[Dict[str, Any]]:
         """Get all clients in the workspace."""
-        return self._make_request("GET", f"workspaces/{self.workspace_id}/clients")
+        return self._make_request("GET", f"{self._ws_root}/clients", conditional=True)
 
     def get_projects(self) -> List[Dict[str, Any]]:
-        """Get all projects in the workspace."""
-        return self._make_request("GET", f"workspaces/{self.workspace_id}/projects")
+        """Get all projects in the workspace, reusing a recent response."""
+        if (self._projects_cache is None
+                or time.monotonic() - self._projects_cache_time >= self.PROJECTS_TTL):
+            projects = self._make_request("GET", f"{self._ws_root}/projects",
+                                          conditional=True)
+            if projects is not self._projects_cache:
+                self._projects_by_name = index_by_name(projects)
+            self._projects_cache = projects
+            self._projects_cache_time = time.monotonic()
+        return self._projects_cache
+
+    def invalidate_projects(self) -> None:
+        """Drop the cached project list so the next get_projects() refetches."""
+        self._projects_cache = None
     
     def get_project_tasks(self, project_id: str) -> List[Dict[str, Any]]:
         """Get all tasks for a specific project."""
-        return self._make_request("GET", f"workspaces/{self.workspace_id}/projects/{project_id}/tasks")
+        return self._make_request("GET", f"{self._ws_root}/projects/{project_id}/tasks")
     
     def get_current_time_entry(self) -> Optional[Dict[str, Any]]:
         """Get current active time entry."""
         user_id = self.get_user_id()
-        entries = self._make_request("GET", f"workspaces/{self.workspace_id}/user/{user_id}/time-entries?in-progress=true")
+        entries = self._make_request("GET", f"{self._ws_root}/user/{user_id}/time-entries?in-progress=true")
         return entries[0] if entries else None
     
     def get_time_entries(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent time entries."""
         user_id = self.get_user_id()
-        return self._make_request("GET", f"workspaces/{self.workspace_id}/user/{user_id}/time-entries?page-size={limit}")
+        return self._make_request("GET", f"{self._ws_root}/user/{user_id}/time-entries?page-size={limit}")
     
     def start_time_entry(self, description: str, project_id: str, task_id: Optional[str] = None) -> Dict[str, Any]:
         """Start a new time entry."""
@@ -92,26 +163,26 @@ class ClockifyAPI:
         print(f"  projectId: {project_id}")
         print(f"  taskId: {task_id}")
 
-        return self._make_request("POST", f"workspaces/{self.workspace_id}/time-entries", data)
+        return self._make_request("POST", f"{self._ws_root}/time-entries", data)
     
     def stop_time_entry(self) -> Dict[str, Any]:
         """Stop the current time entry."""
         user_id = self.get_user_id()
         end_time = datetime.utcnow().isoformat() + "Z"
         data = {"end": end_time}
-        return self._make_request("PATCH", f"workspaces/{self.workspace_id}/user/{user_id}/time-entries", data)
+        return self._make_request("PATCH", f"{self._ws_root}/user/{user_id}/time-entries", data)
     
     def create_task(self, project_id: str, task_name: str) -> Dict[str, Any]:
         """Create a new task in the specified project."""
         data = {
             "name": task_name
         }
-        return self._make_request("POST", f"workspaces/{self.workspace_id}/projects/{project_id}/tasks", data)
+        return self._make_request("POST", f"{self._ws_root}/projects/{project_id}/tasks", data)
     
     def delete_task(self, project_id: str, task_id: str) -> bool:
         """Delete a task from a project."""
         try:
-            self._make_request("DELETE", f"workspaces/{self.workspace_id}/projects/{project_id}/tasks/{task_id}")
+            self._make_request("DELETE", f"{self._ws_root}/projects/{project_id}/tasks/{task_id}")
             return True
         except ClockifyAPIError:
             return False
@@ -119,11 +190,17 @@ class ClockifyAPI:
     def delete_time_entry(self, entry_id: str) -> bool:
         """Delete a time entry."""
         try:
-            self._make_request("DELETE", f"workspaces/{self.workspace_id}/time-entries/{entry_id}")
+            self._make_request("DELETE", f"{self._ws_root}/time-entries/{entry_id}")
             # If no exception was raised, deletion was successful
             return True
         except ClockifyAPIError:
             return False
+
+    def delete_time_entries(self, entry_ids: Iterable[str]) -> Iterator[bool]:
+        """Delete several time entries concurrently, yielding results in order."""
+        # One worker per pooled connection; there is no batch-delete endpoint
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            yield from executor.map(self.delete_time_entry, entry_ids)
     
     def create_time_entry(self, project_id: str, task_id: Optional[str], description: str, 
                          start_time: str, end_time: str) -> Dict[str, Any]:
@@ -137,49 +214,42 @@ class ClockifyAPI:
         if task_id:
             data["taskId"] = task_id
             
-        return self._make_request("POST", f"workspaces/{self.workspace_id}/time-entries", data)
+        return self._make_request("POST", f"{self._ws_root}/time-entries", data)
     
     def find_project_by_name(self, project_name: str) -> Optional[Dict[str, Any]]:
         """Find project by name."""
-        projects = self.get_projects()
-        for project in projects:
-            if project["name"] == project_name:
-                return project
-        return None
+        self.get_projects()
+        return self._projects_by_name.get(project_name)
     
-    def find_task_by_name(self, project_id: str, task_name: str) -> Optional[Dict[str, Any]]:
-        """Find task by name in a specific project."""
+    def get_descriptions_for_task(self, project_id: str, task_id: str, task_name: str, limit: int = 50,
+                                  entries: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """Get unique descriptions used with a specific task, from entries if given."""
         try:
-            tasks = self.get_project_tasks(project_id)
-            for task in tasks:
-                if task["name"] == task_name:
-                    return task
-            return None
-        except Exception:
-            return None
-    
-    def get_descriptions_for_task(self, project_id: str, task_id: str, task_name: str, limit: int = 50) -> List[str]:
-        """Get unique descriptions used with a specific task."""
-        try:
-            entries = self.get_time_entries(limit)
+            if entries is None:
+                entries = self.get_time_entries(limit)
             descriptions = set()
-            
+            add = descriptions.add
+
             for entry in entries:
-                entry_project_id = entry.get("projectId")
-                entry_task_id = entry.get("taskId")
-                entry_description = entry.get("description", "").strip()
-                
-                # Must be from the same project and have a description
-                if entry_project_id != project_id or not entry_description:
+                # Must be from the same project
+                if entry.get("projectId") != project_id:
                     continue
-                
+
                 # Include entries that either:
                 # 1. Have the matching task ID, OR
                 # 2. Have no task ID (legacy entries from before formal tasks were assigned)
-                if entry_task_id == task_id or entry_task_id is None:
-                    descriptions.add(entry_description)
-            
-            return sorted(list(descriptions))
+                entry_task_id = entry.get("taskId")
+                if entry_task_id != task_id and entry_task_id is not None:
+                    continue
+
+                # Only strip descriptions of entries that passed the ID checks
+                entry_description = entry.get("description")
+                if entry_description:
+                    entry_description = entry_description.strip()
+                    if entry_description:
+                        add(entry_description)
+
+            return sorted(descriptions)
         except Exception as e:
             print(f"Error getting descriptions for task: {e}")
             return []
\ No newline at end of file
@@ -1,19 +1,26 @@
 """
 Client management functionality for Clockify CLI.
 """
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from .api_client import ClockifyAPI
 from .config import ClockifyConfig
-from .utils import get_user_selection
+from .utils import get_user_selection, index_by_name
+
+if TYPE_CHECKING:
+    from .data_cache import DataCache
 
 
 class ClientManager:
     """Handles client selection and management."""
 
-    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, cache=None):
+    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, cache: Optional["DataCache"] = None) -> None:
         self.api = api
         self.config = config
         self.cache = cache
+        # Lookup indexes for the client list they were built from
+        self._indexed_clients: Optional[List[dict]] = None
+        self._by_id: Dict[str, dict] = {}
+        self._by_name: Dict[str, dict] = {}
 
     def get_clients(self) -> List[dict]:
         """Get all clients from the workspace."""
@@ -26,21 +33,24 @@ class ClientManager:
         clients = self.get_clients()
         return [client["name"] for client in clients]
 
+    def _index(self) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+        """Return (by ID, by name) indexes, rebuilt whenever the client list changes."""
+        clients = self.get_clients()
+        if clients is not self._indexed_clients:
+            self._by_id = {client["id"]: client for client in clients}
+            self._by_name = index_by_name(clients)
+            self._indexed_clients = clients
+        return self._by_id, self._by_name
+
     def find_client_by_name(self, name: str) -> Optional[dict]:
         """Find client by name."""
-        clients = self.get_clients()
-        for client in clients:
-            if client["name"] == name:
-                return client
-        return None
+        return self._index()[1].get(name)
 
     def find_client_by_id(self, client_id: str) -> Optional[dict]:
         """Find client by ID."""
-        clients = self.get_clients()
-        for client in clients:
-            if client["id"] == client_id:
-                return client
-        return None
+        if self.cache:
+            return self.cache.find_client_by_id(client_id)
+        return self._index()[0].get(client_id)
 
     def get_current_client(self) -> Optional[dict]:
         """Get the current client from config."""
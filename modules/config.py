@@ -1,16 +1,19 @@
 """
 Configuration management for Clockify CLI.
 """
-import os
 import json
-from typing import Optional, Dict, Any
+from contextlib import contextmanager
+from typing import Iterator, Optional, Dict, Any
 from pathlib import Path
+from .utils import json_dumps, json_loads, write_atomic
 
 
 class ClockifyConfig:
     """Manages Clockify configuration storage and retrieval."""
+
+    _shared: Optional["ClockifyConfig"] = None
     
-    def __init__(self, config_dir: Optional[str] = None):
+    def __init__(self, config_dir: Optional[str] = None) -> None:
         if config_dir:
             self.config_dir = Path(config_dir)
         else:
@@ -21,39 +24,96 @@ class ClockifyConfig:
         
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
+
+        # Modification times of the files as last read or written
+        self._config_mtime: Optional[float] = None
+        self._state_mtime: Optional[float] = None
+
+        # Writes deferred by batch(): nesting depth and files awaiting a save
+        self._batch_depth = 0
+        self._dirty_config = False
+        self._dirty_state = False
         
         self._config = self._load_config()
         self._state = self._load_state()
     
+    @classmethod
+    def get_shared(cls) -> "ClockifyConfig":
+        """Return the process-wide configuration, re-reading files changed on disk."""
+        if cls._shared is None:
+            cls._shared = cls()
+        else:
+            cls._shared.reload_if_changed()
+        return cls._shared
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[float]:
+        """Modification time of a file, or None if it doesn't exist."""
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> None:
+        """Re-read the config and state files if another process changed them."""
+        if self._mtime(self.config_file) != self._config_mtime:
+            self._config = self._load_config()
+        if self._mtime(self.state_file) != self._state_mtime:
+            self._state = self._load_state()
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {}
+        self._config_mtime = self._mtime(self.config_file)
+        try:
+            data = self.config_file.read_bytes()
+            return json_loads(data) if data else {}
+        except (json.JSONDecodeError, IOError):
+            return {}
     
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file."""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {}
+        self._state_mtime = self._mtime(self.state_file)
+        try:
+            data = self.state_file.read_bytes()
+            return json_loads(data) if data else {}
+        except (json.JSONDecodeError, IOError):
+            return {}
     
+    @contextmanager
+    def batch(self) -> Iterator["ClockifyConfig"]:
+        """Defer config and state writes until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write any config or state changes deferred by batch()."""
+        if self._dirty_config:
+            self.save_config()
+        if self._dirty_state:
+            self.save_state()
+
     def save_config(self) -> None:
         """Save configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(self._config, f, indent=2)
+        if self._batch_depth:
+            self._dirty_config = True
+            return
+        self._dirty_config = False
+        write_atomic(self.config_file, json_dumps(self._config, indent=True))
+        self._config_mtime = self._mtime(self.config_file)
     
     def save_state(self) -> None:
         """Save state to file."""
-        with open(self.state_file, 'w') as f:
-            json.dump(self._state, f, indent=2)
+        if self._batch_depth:
+            self._dirty_state = True
+            return
+        self._dirty_state = False
+        write_atomic(self.state_file, json_dumps(self._state, indent=True))
+        self._state_mtime = self._mtime(self.state_file)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
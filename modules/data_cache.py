@@ -4,80 +4,375 @@ import os
 Data caching system for Clockify CLI.
 Loads all data once at startup to avoid repeated API calls during menu interactions.
 """
-from typing import List, Dict, Any, Optional
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple
 from .api_client import ClockifyAPI
+from .utils import index_by_name, json_dumps, json_loads, write_atomic
+
+# Resource groups that can be preloaded by load_all()
+RESOURCES = frozenset({"clients", "projects", "tasks", "time_entries"})
+
+# Resource groups that change rarely enough to be reused across invocations
+PERSISTED_RESOURCES = frozenset({"clients", "projects", "tasks"})
+
+# Seconds a project found to have no tasks is assumed to still have none
+EMPTY_PROJECT_MAX_AGE = 3600
 
 
 class DataCache:
     """Caches all Clockify data fetched at startup."""
 
-    def __init__(self, api: ClockifyAPI):
+    def __init__(self, api: ClockifyAPI, disk_path: Optional[Path] = None, max_age: float = 300) -> None:
+        """Initialize the cache.
+
+        Args:
+            api: API client used to fetch data
+            disk_path: Optional file persisting clients, projects and tasks
+                       between invocations (see load_all())
+            max_age: Maximum age in seconds of persisted data to reuse
+        """
         self.api = api
+        self.max_age = max_age
         self._clients: List[Dict[str, Any]] = []
         self._projects: List[Dict[str, Any]] = []
+        self._clients_by_id: Dict[str, Dict[str, Any]] = {}
+        self._projects_by_id: Dict[str, Dict[str, Any]] = {}
+        self._projects_by_name: Dict[str, Dict[str, Any]] = {}
+        # Project ID -> (task list the index was built from, tasks by name)
+        self._task_name_index: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = {}
         self._tasks_by_project: Dict[str, List[Dict[str, Any]]] = {}
+        # Project ID -> when it was last seen to have no tasks
+        self._empty_projects: Dict[str, float] = {}
         self._time_entries: List[Dict[str, Any]] = []
         self._user_id: Optional[str] = None
-        self._loaded = False
+        self._loaded: Set[str] = set()
+        self._fetched_at: Dict[str, float] = {}
+        self._disk_path: Optional[Path] = disk_path
+        # Serializes loading and saving with prefetch() running on another thread
+        self._lock = threading.RLock()
+
+    def load_all(self, time_entries_limit: int = 100, resources: Optional[Set[str]] = None,
+                 force: bool = False) -> None:
+        """Load data from API at once.
+
+        With a disk cache file, groups persisted there less than max_age
+        seconds ago are reused instead, and freshly fetched ones are saved.
+
+        Args:
+            time_entries_limit: Number of recent time entries to load
+            resources: Resource groups to load (see RESOURCES). Defaults to all.
+                       Anything not loaded here is fetched on demand.
+            force: Fetch everything from the API, ignoring the disk cache
+        """
+        if resources is None:
+            resources = RESOURCES
+        if resources and self._disk_path and not force:
+            resources = resources - self.load_from_disk(self._disk_path, self.max_age)
+        if not resources:
+            return
+
+        def load_projects_and_tasks() -> None:
+            # Tasks are fetched per project, so they need the project list first
+            self._load_projects()
+            if "tasks" in resources:
+                self._load_tasks()
+
+        # The resource groups are independent GETs, so fetch them in parallel
+        jobs = []
+        if "clients" in resources:
+            jobs.append(self._load_clients)
+        if "projects" in resources or "tasks" in resources:
+            jobs.append(load_projects_and_tasks)
+        if "time_entries" in resources:
+            jobs.append(lambda: self._load_time_entries(time_entries_limit))
 
-    def load_all(self, time_entries_limit: int = 100) -> None:
-        """Load all data from API at once."""
         print("Loading workspace data...", end=" ", flush=True)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(job) for job in jobs]
+            for future in as_completed(futures):
+                # Re-raise the first ClockifyAPIError from any worker
+                future.result()
+        print("Done!")
+
+        self.save_to_disk()
 
-        # Load user ID
-        self._user_id = self.api.get_user_id()
+        # clear the console after loading; an escape sequence avoids
+        # spawning clear(1), and is skipped when output isn't a terminal
+        if os.name == "nt":
+            os.system("cls")
+        elif sys.stdout.isatty():
+            sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+            sys.stdout.flush()
 
-        # Load clients
-        self._clients = self.api.get_clients()
+    def _load_clients(self) -> None:
+        """Load clients."""
+        self._set_clients(self.api.get_clients())
+        self._mark_fetched("clients")
 
-        # Load projects
-        self._projects = self.api.get_projects()
+    def _load_projects(self) -> None:
+        """Load projects."""
+        self._set_projects(self.api.get_projects())
+        self._mark_fetched("projects")
 
-        # Load tasks for each project
-        for project in self._projects:
+    def _load_tasks(self) -> None:
+        """Load tasks for each cached project."""
+        self._store_tasks(*self._fetch_tasks(self._projects))
+
+    def _fetch_tasks(self, projects: List[Dict[str, Any]],
+                     parallel: bool = True) -> Tuple[float, Dict[str, Optional[List[Dict[str, Any]]]]]:
+        """Fetch the tasks of the given projects, several at a time if parallel.
+
+        Returns the fetch time and each project's task list; None marks a
+        failed fetch, and projects recently seen to have no tasks (e.g.
+        archived ones) are skipped.
+        """
+        def fetch(project_id: str) -> Optional[List[Dict[str, Any]]]:
             try:
-                tasks = self.api.get_project_tasks(project["id"])
-                self._tasks_by_project[project["id"]] = tasks
+                return self.api.get_project_tasks(project_id)
             except Exception:
-                self._tasks_by_project[project["id"]] = []
+                return None
 
-        # Load recent time entries
-        self._time_entries = self.api.get_time_entries(limit=time_entries_limit)
+        now = time.time()
+        project_ids = [
+            project["id"] for project in projects
+            if now - self._empty_projects.get(project["id"], 0) >= EMPTY_PROJECT_MAX_AGE
+        ]
 
-        self._loaded = True
-        print("Done!")
+        # One independent GET per project; overlap them on the session's pool
+        if parallel:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(fetch, project_ids))
+        else:
+            results = list(map(fetch, project_ids))
+        fetched = {project["id"]: [] for project in projects}
+        fetched.update(zip(project_ids, results))
+        return now, fetched
+
+    def _store_tasks(self, now: float, fetched: Dict[str, Optional[List[Dict[str, Any]]]]) -> None:
+        """Store task lists returned by _fetch_tasks() and mark tasks loaded."""
+        for project_id, tasks in fetched.items():
+            if tasks == []:
+                # Keep the time of a still-current "no tasks" result it was skipped for
+                if now - self._empty_projects.get(project_id, 0) >= EMPTY_PROJECT_MAX_AGE:
+                    self._empty_projects[project_id] = now
+            elif tasks is not None:
+                self._empty_projects.pop(project_id, None)
+            self._tasks_by_project[project_id] = tasks or []
+        self._mark_fetched("tasks")
+
+    def _load_time_entries(self, limit: int = 100) -> None:
+        """Load recent time entries."""
+        # Time entries are per user; keep the ID for the cache file
+        self.get_user_id()
+        self._time_entries = self.api.get_time_entries(limit=limit)
+        self._mark_fetched("time_entries")
+
+    def _set_clients(self, clients: List[Dict[str, Any]]) -> None:
+        """Store clients and index them by ID."""
+        self._clients = clients
+        self._clients_by_id = {client["id"]: client for client in clients}
+
+    def _set_projects(self, projects: List[Dict[str, Any]]) -> None:
+        """Store projects and index them by ID and name."""
+        self._projects = projects
+        self._projects_by_id = {project["id"]: project for project in projects}
+        self._projects_by_name = index_by_name(projects)
+
+    def _ensure_loaded(self, resource: str) -> None:
+        """Load clients or projects unless already loaded."""
+        if resource not in self._loaded:
+            with self._lock:
+                if resource not in self._loaded:
+                    getattr(self, f"_load_{resource}")()
+
+    def prefetch(self, resource: str) -> None:
+        """Load clients, projects or tasks ahead of need and persist them to the disk cache.
+
+        Meant to run on a daemon thread. It fetches without holding the cache
+        lock, taking it only to publish the results, so foreground lookups
+        never wait on it; a group the foreground loaded meanwhile is kept.
+        Tasks are fetched one project at a time rather than on a worker pool,
+        whose threads would hold up interpreter exit.
+        """
+        if resource in self._loaded:
+            return
+        if resource == "clients":
+            clients = self.api.get_clients()
+        else:
+            # Tasks are fetched per project, so they need the project list too
+            projects = self._projects if "projects" in self._loaded else self.api.get_projects()
+            if resource == "tasks":
+                tasks = self._fetch_tasks(projects, parallel=False)
 
-        # clear the console after loading
-        os.system("cls" if os.name == "nt" else "clear")
+        with self._lock:
+            if resource == "clients":
+                if "clients" not in self._loaded:
+                    self._set_clients(clients)
+                    self._mark_fetched("clients")
+            else:
+                if "projects" not in self._loaded:
+                    self._set_projects(projects)
+                    self._mark_fetched("projects")
+                if resource == "tasks" and "tasks" not in self._loaded and projects is self._projects:
+                    self._store_tasks(*tasks)
+            self.save_to_disk()
 
-    def refresh(self, time_entries_limit: int = 100) -> None:
-        """Refresh all cached data."""
-        self.load_all(time_entries_limit)
+    def _mark_fetched(self, resource: str) -> None:
+        """Record that a resource group was just fetched from the API."""
+        self._loaded.add(resource)
+        self._fetched_at[resource] = time.time()
+
+    def save_to_disk(self, path: Optional[Path] = None) -> None:
+        """Persist loaded clients, projects and tasks for later invocations.
+
+        Args:
+            path: Cache file to write. Defaults to the file last used with
+                  load_from_disk() or save_to_disk().
+        """
+        path = path or self._disk_path
+        if path is None:
+            return
+        self._disk_path = path
+
+        with self._lock:
+            data: Dict[str, Any] = {"user_id": self._user_id, "fetched_at": {}}
+            for resource in PERSISTED_RESOURCES & self._loaded:
+                if resource in self._fetched_at:
+                    data["fetched_at"][resource] = self._fetched_at[resource]
+            if "clients" in data["fetched_at"]:
+                data["clients"] = self._clients
+            if "projects" in data["fetched_at"]:
+                data["projects"] = self._projects
+            if "tasks" in data["fetched_at"]:
+                data["tasks_by_project"] = self._tasks_by_project
+            if self._empty_projects:
+                data["empty_projects"] = self._empty_projects
+            # Lets the next invocation revalidate expired groups with If-None-Match
+            validators = self.api.get_validators()
+            if validators:
+                data["etags"] = validators
+
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(path, json_dumps(data))
+            except OSError:
+                pass
+
+    def load_from_disk(self, path: Path, max_age: float = 300) -> Set[str]:
+        """Load resource groups saved by save_to_disk() that are still fresh.
+
+        Args:
+            path: Cache file to read
+            max_age: Maximum age in seconds of a resource group to reuse it
+
+        Returns:
+            Set of resource groups loaded from disk
+        """
+        self._disk_path = path
+        try:
+            with open(path, 'rb') as f:
+                data = json_loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            return set()
+        if not isinstance(data, dict):
+            # Not something save_to_disk() wrote; treat it as a miss
+            return set()
+
+        now = time.time()
+        loaded = set()
+        for resource, fetched_at in data.get("fetched_at", {}).items():
+            if resource not in PERSISTED_RESOURCES or now - fetched_at > max_age:
+                continue
+            if resource == "clients":
+                self._set_clients(data.get("clients", []))
+            elif resource == "projects":
+                self._set_projects(data.get("projects", []))
+            elif resource == "tasks":
+                self._tasks_by_project = data.get("tasks_by_project", {})
+            self._loaded.add(resource)
+            self._fetched_at[resource] = fetched_at
+            loaded.add(resource)
+
+        # Tasks are keyed by project, so they are only usable with the project list
+        if "tasks" in loaded and "projects" not in loaded:
+            self._loaded.discard("tasks")
+            del self._fetched_at["tasks"]
+            loaded.discard("tasks")
+
+        if data.get("user_id"):
+            self._user_id = data["user_id"]
+            self.api.set_user_id(self._user_id)
+
+        # ETags outlive max_age: an expired group is refetched conditionally
+        try:
+            self.api.seed_validators(data.get("etags", {}))
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+        # Negative results have their own, longer expiry
+        for project_id, seen_at in data.get("empty_projects", {}).items():
+            if now - seen_at < EMPTY_PROJECT_MAX_AGE:
+                self._empty_projects[project_id] = seen_at
+
+        return loaded
+
+    def refresh(self, time_entries_limit: int = 100, force: bool = True) -> None:
+        """Refresh all cached data, bypassing the disk cache unless force is False."""
+        self.load_all(time_entries_limit, force=force)
 
     def get_clients(self) -> List[Dict[str, Any]]:
-        """Get cached clients."""
-        if not self._loaded:
-            self._clients = self.api.get_clients()
+        """Get cached clients, fetching them on first use."""
+        self._ensure_loaded("clients")
         return self._clients
 
     def get_projects(self) -> List[Dict[str, Any]]:
-        """Get cached projects."""
-        if not self._loaded:
-            self._projects = self.api.get_projects()
+        """Get cached projects, fetching them on first use."""
+        self._ensure_loaded("projects")
         return self._projects
 
+    def find_client_by_id(self, client_id: str) -> Optional[Dict[str, Any]]:
+        """Find a cached client by ID."""
+        self._ensure_loaded("clients")
+        return self._clients_by_id.get(client_id)
+
+    def find_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Find a cached project by ID."""
+        self._ensure_loaded("projects")
+        return self._projects_by_id.get(project_id)
+
+    def find_project_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a cached project by name."""
+        self._ensure_loaded("projects")
+        return self._projects_by_name.get(name)
+
+    def find_task_by_name(self, project_id: str, name: str) -> Optional[Dict[str, Any]]:
+        """Find a cached task of a project by name."""
+        tasks = self.get_project_tasks(project_id)
+        indexed = self._task_name_index.get(project_id)
+        if indexed is None or indexed[0] is not tasks:
+            indexed = self._task_name_index[project_id] = (tasks, index_by_name(tasks))
+        return indexed[1].get(name)
+
     def get_project_tasks(self, project_id: str) -> List[Dict[str, Any]]:
-        """Get cached tasks for a project."""
-        if not self._loaded or project_id not in self._tasks_by_project:
-            tasks = self.api.get_project_tasks(project_id)
-            self._tasks_by_project[project_id] = tasks
-            return tasks
-        return self._tasks_by_project[project_id]
+        """Get cached tasks for a project, fetching them on first use."""
+        tasks = self._tasks_by_project.get(project_id)
+        if tasks is None:
+            with self._lock:
+                tasks = self._tasks_by_project.get(project_id)
+                if tasks is None:
+                    tasks = self._tasks_by_project[project_id] = self.api.get_project_tasks(project_id)
+        return tasks
 
     def get_time_entries(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get cached time entries."""
-        if not self._loaded:
-            self._time_entries = self.api.get_time_entries(limit)
+        """Get cached time entries, fetching them on first use."""
+        if "time_entries" not in self._loaded:
+            with self._lock:
+                self._load_time_entries(limit)
         return self._time_entries
 
     def get_user_id(self) -> str:
@@ -88,13 +383,27 @@ class DataCache:
 
     def invalidate_tasks(self, project_id: str) -> None:
         """Invalidate cached tasks for a specific project (e.g., after creating/deleting a task)."""
-        if project_id in self._tasks_by_project:
-            del self._tasks_by_project[project_id]
+        with self._lock:
+            self._tasks_by_project.pop(project_id, None)
+            self._empty_projects.pop(project_id, None)
+            # Drop the persisted task list so other invocations refetch it
+            if self._fetched_at.pop("tasks", None) is not None:
+                self.save_to_disk()
+
+    def invalidate_projects(self) -> None:
+        """Invalidate cached projects so the next lookup fetches them from the API."""
+        with self._lock:
+            self.api.invalidate_projects()
+            self._loaded.discard("projects")
+            # Drop the persisted project list so other invocations refetch it
+            if self._fetched_at.pop("projects", None) is not None:
+                self.save_to_disk()
 
     def invalidate_time_entries(self) -> None:
         """Invalidate cached time entries (e.g., after creating a new entry)."""
         self._time_entries = []
+        self._loaded.discard("time_entries")
 
     def is_loaded(self) -> bool:
-        """Check if cache has been loaded."""
-        return self._loaded
+        """Check if every resource group has been loaded."""
+        return self._loaded >= RESOURCES
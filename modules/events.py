@@ -6,14 +6,35 @@ import json
 import re
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from operator import itemgetter
+from typing import Iterable, List, Dict, Any, Optional
 from pathlib import Path
+from .utils import json_dumps, json_loads, write_atomic
+
+# Every gnome-pomodoro journal marker in one alternation, so each message is
+# scanned once. Each branch has one named group; match.lastgroup tells which
+# marker hit ("raw" starts a new event, the rest are event fields).
+_MARKER_RE = re.compile(
+    r"(?P<raw>DEBUG: Raw argv=)"
+    r"|DEBUG: Command=(?P<event_type>\w+)"
+    r"|^Starting time entry:\s+(?P<start_description>.+?)(?:\s+\(Task:.+\))?$"
+    r"|description:\s+(?P<description>.+)$"
+    r"|projectId:\s+(?P<project_id>\S+)$"
+    r"|taskId:\s+(?P<task_id>\S+)$"
+    r"|Time entry (?:started|stopped) successfully.*?ID:\s+(?P<entry_id>\S+)\)"
+)
+
+# Marker group -> event field, where they differ
+_MARKER_FIELDS = {"start_description": "description"}
+
+_by_timestamp = itemgetter("timestamp")
 
 
 class PomodoroEventExtractor:
     """Extracts pomodoro events from system journal."""
 
-    def __init__(self, config_dir: Optional[Path] = None):
+    def __init__(self, config_dir: Optional[Path] = None) -> None:
         """Initialize event extractor.
 
         Args:
@@ -27,6 +48,10 @@ class PomodoroEventExtractor:
         self.events_file = self.config_dir / "events.json"
         self.events = []
 
+        # Saved events (most recent first) as of events_file's mtime_ns
+        self._saved_events: Optional[List[Dict[str, Any]]] = None
+        self._saved_mtime: Optional[int] = None
+
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
@@ -39,53 +64,50 @@ class PomodoroEventExtractor:
         Returns:
             List of event dictionaries
         """
+        # Let journalctl filter to gnome-pomodoro and emit one JSON record per line
         cmd = [
             "journalctl",
             "--user",
+            "--identifier=gnome-pomodoro",
             "--since", since,
-            "--output=short-iso"
+            "--output=json",
+            "--no-pager"
         ]
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            self._parse_journal(result.stdout)
-            return self.events
-        except subprocess.CalledProcessError as e:
-            print(f"Error running journalctl: {e}")
+        # Parse while journalctl is still writing instead of buffering it all
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                              text=True, bufsize=1) as proc:
+            self._parse_journal(proc.stdout)
+
+        if proc.returncode:
+            print(f"Error running journalctl: exit status {proc.returncode}")
             return []
+        return self.events
 
-    def _parse_journal(self, journal_output: str) -> None:
-        """Parse journal output and extract pomodoro events."""
-        lines = journal_output.split('\n')
+    def _parse_journal(self, journal_lines: Iterable[str]) -> None:
+        """Parse journalctl JSON output lines and extract pomodoro events."""
         current_event = {}
 
-        for line in lines:
-            # Skip empty lines
-            if not line.strip():
+        for line in journal_lines:
+            try:
+                record = json_loads(line)
+                # Microseconds since the epoch; events keep whole-second local time
+                timestamp = datetime.fromtimestamp(int(record["__REALTIME_TIMESTAMP"]) // 1_000_000)
+            except (ValueError, KeyError):
                 continue
 
-            # Match timestamp and process lines
-            timestamp_match = re.match(
-                r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2})\s+\S+\s+gnome-pomodoro\[\d+\]:\s+(.+)$',
-                line
-            )
-            if not timestamp_match:
+            message = record.get("MESSAGE")
+            # Non-UTF-8 messages are encoded as byte arrays; they're not ours
+            if not isinstance(message, str):
                 continue
 
-            timestamp_str = timestamp_match.group(1)
-            message = timestamp_match.group(2)
-
-            # Parse timestamp
-            try:
-                # Parse ISO format with timezone
-                timestamp = datetime.fromisoformat(timestamp_str)
-                # Convert to naive datetime (remove timezone)
-                timestamp = timestamp.replace(tzinfo=None)
-            except ValueError:
+            match = _MARKER_RE.search(message)
+            if match is None:
                 continue
+            marker = match.lastgroup
 
             # Check for command execution (DEBUG: Raw argv=...)
-            if "DEBUG: Raw argv=" in message:
+            if marker == "raw":
                 # Save previous event if it exists
                 if current_event:
                     self._add_event(current_event)
@@ -97,47 +119,9 @@ class PomodoroEventExtractor:
                     "time": timestamp.strftime("%H:%M:%S"),
                 }
 
-            # Extract command type
-            elif "DEBUG: Command=" in message and current_event:
-                cmd_match = re.search(r"Command=(\w+)", message)
-                if cmd_match:
-                    current_event["event_type"] = cmd_match.group(1)
-
-            # Extract description from "Starting time entry:" line
-            elif message.startswith("Starting time entry:") and current_event:
-                desc_match = re.search(r"Starting time entry:\s+(.+?)(?:\s+\(Task:.+\))?$", message)
-                if desc_match:
-                    current_event["description"] = desc_match.group(1).strip()
-
-            # Extract description detail
-            elif "description:" in message and current_event:
-                desc_match = re.search(r"description:\s+(.+)$", message)
-                if desc_match:
-                    current_event["description"] = desc_match.group(1).strip()
-
-            # Extract project ID
-            elif "projectId:" in message and current_event:
-                proj_match = re.search(r"projectId:\s+(\S+)$", message)
-                if proj_match:
-                    current_event["project_id"] = proj_match.group(1).strip()
-
-            # Extract task ID
-            elif "taskId:" in message and current_event:
-                task_match = re.search(r"taskId:\s+(\S+)$", message)
-                if task_match:
-                    current_event["task_id"] = task_match.group(1).strip()
-
-            # Extract entry ID (started)
-            elif "Time entry started successfully" in message and current_event:
-                entry_match = re.search(r"ID:\s+(\S+)\)", message)
-                if entry_match:
-                    current_event["entry_id"] = entry_match.group(1).strip()
-
-            # Extract entry ID (stopped)
-            elif "Time entry stopped successfully" in message and current_event:
-                entry_match = re.search(r"ID:\s+(\S+)\)", message)
-                if entry_match:
-                    current_event["entry_id"] = entry_match.group(1).strip()
+            # Extract a field of the current event
+            elif current_event:
+                current_event[_MARKER_FIELDS.get(marker, marker)] = match.group(marker).strip()
 
         # Add final event
         if current_event:
@@ -163,28 +147,36 @@ class PomodoroEventExtractor:
         if merge and os.path.exists(filename):
             # Load existing events
             try:
-                with open(filename, 'r') as f:
-                    existing_events = json.load(f)
+                with open(filename, 'rb') as f:
+                    existing_events = json_loads(f.read())
             except (json.JSONDecodeError, IOError):
                 existing_events = []
 
-            # Merge events and deduplicate by timestamp
-            all_events = existing_events + self.events
-            seen_timestamps = set()
-            unique_events = []
-
-            for event in all_events:
+            # Merge events and deduplicate by timestamp; the first seen wins,
+            # so saved events take precedence over newly extracted ones
+            merged = {}
+            for event in chain(existing_events, self.events):
                 timestamp = event.get("timestamp")
-                if timestamp and timestamp not in seen_timestamps:
-                    seen_timestamps.add(timestamp)
-                    unique_events.append(event)
+                if timestamp:
+                    merged.setdefault(timestamp, event)
 
-            # Sort by timestamp
-            unique_events.sort(key=lambda e: e.get("timestamp", ""))
-            events_to_save = unique_events
+            # Sort by timestamp (the saved file is already sorted, so this is
+            # mostly a linear pass)
+            events_to_save = sorted(merged.values(), key=_by_timestamp)
 
-        with open(filename, 'w') as f:
-            json.dump(events_to_save, f, indent=2)
+        write_atomic(filename, json_dumps(events_to_save, indent=True))
+
+        if os.path.abspath(filename) == os.path.abspath(self.events_file):
+            self._remember_saved(events_to_save)
+
+    def _remember_saved(self, events: List[Dict[str, Any]]) -> None:
+        """Keep the saved events in memory, tied to the events file's current mtime."""
+        try:
+            self._saved_mtime = self.events_file.stat().st_mtime_ns
+        except OSError:
+            self._saved_events = self._saved_mtime = None
+            return
+        self._saved_events = events[::-1]  # Most recent first
 
     def get_saved_events(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get events from saved file.
@@ -195,22 +187,26 @@ class PomodoroEventExtractor:
         Returns:
             List of events (most recent first)
         """
-        if not self.events_file.exists():
-            return []
-
         try:
-            with open(self.events_file, 'r') as f:
-                events = json.load(f)
-            events.reverse()  # Most recent first
-
-            if limit:
-                return events[:limit]
-            return events
-        except (json.JSONDecodeError, IOError):
+            mtime = self.events_file.stat().st_mtime_ns
+        except OSError:
             return []
 
+        # Re-read only if the file changed since it was last saved or read
+        if self._saved_events is None or mtime != self._saved_mtime:
+            try:
+                with open(self.events_file, 'rb') as f:
+                    events = json_loads(f.read())
+            except (json.JSONDecodeError, IOError):
+                return []
+            self._remember_saved(events)
+
+        if limit:
+            return self._saved_events[:limit]
+        return list(self._saved_events)
+
     def clear_events(self) -> None:
         """Clear all logged events from file."""
         if self.events_file.exists():
-            with open(self.events_file, 'w') as f:
-                json.dump([], f)
+            write_atomic(self.events_file, json_dumps([]))
+            self._saved_events = self._saved_mtime = None
@@ -1,8 +1,22 @@
 """
 Pomodoro timer integration via D-Bus for Gnome Pomodoro.
 """
+import re
 import subprocess
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+# PyGObject is imported by PomodoroIntegration._connection() on the first
+# D-Bus call; loading it and its typelibs at import time would slow every
+# CLI start. Without it, calls fall back to spawning gdbus.
+Gio = GLib = None
+
+# D-Bus type codes for the Python argument types passed to _call_dbus
+_DBUS_TYPES = {str: "s", float: "d"}
+
+# String value inside gdbus variant output like "(<'pomodoro'>,)"
+_STATE_RE = re.compile(r"<'([^']+)'>")
 
 
 class PomodoroError(Exception):
@@ -12,45 +26,82 @@ class PomodoroError(Exception):
 
 class PomodoroIntegration:
     """Integration with Gnome Pomodoro timer via D-Bus."""
+
+    AVAILABILITY_TTL = 30  # seconds; Gnome Pomodoro rarely appears or vanishes
+    STATE_TTL = 1.5  # seconds; covers back-to-back is_running/get_current_state
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.dbus_dest = "org.gnome.Pomodoro"
         self.dbus_path = "/org/gnome/Pomodoro"
         self.dbus_interface = "org.gnome.Pomodoro"
-    
-    def _call_dbus(self, method: str, *args) -> str:
-        """Make D-Bus call to Gnome Pomodoro."""
+        self._available: Optional[Tuple[float, bool]] = None
+        self._state: Optional[Tuple[float, Optional[str]]] = None
+        self._bus: Optional["Gio.DBusConnection"] = None
+        self._use_gio = True
+
+    def _connection(self) -> Optional["Gio.DBusConnection"]:
+        """Return the session bus connection, opened on first use; None without PyGObject."""
+        global Gio, GLib
+        if self._bus is None and self._use_gio:
+            try:
+                from gi.repository import Gio, GLib
+            except ImportError:
+                self._use_gio = False
+                return None
+            try:
+                self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+            except GLib.Error as e:
+                raise PomodoroError(f"Could not connect to the session bus: {e.message}")
+        return self._bus
+
+    def _invoke(self, interface: str, method: str, args: tuple, error: str) -> "GLib.Variant":
+        """Call a Gnome Pomodoro method over the shared bus connection."""
+        signature = "".join(_DBUS_TYPES[type(arg)] for arg in args)
+        try:
+            return self._connection().call_sync(
+                self.dbus_dest, self.dbus_path, interface, method,
+                GLib.Variant(f"({signature})", args), None,
+                Gio.DBusCallFlags.NONE, -1, None
+            )
+        except GLib.Error as e:
+            raise PomodoroError(f"{error}: {e.message}")
+
+    def _run_gdbus(self, method: str, args: tuple, error: str) -> str:
+        """Call a Gnome Pomodoro method by spawning gdbus; returns its output."""
         cmd = [
             "gdbus", "call", "--session",
             "--dest", self.dbus_dest,
             "--object-path", self.dbus_path,
-            "--method", f"{self.dbus_interface}.{method}"
+            "--method", method
         ]
-        cmd.extend(str(arg) for arg in args)
-        
+        cmd.extend(repr(arg) for arg in args)
+
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
-            raise PomodoroError(f"D-Bus call failed: {e.stderr}")
+            raise PomodoroError(f"{error}: {e.stderr}")
         except FileNotFoundError:
             raise PomodoroError("gdbus command not found. Is D-Bus installed?")
-    
-    def _get_property(self, property_name: str) -> str:
-        """Get a property from Gnome Pomodoro."""
-        cmd = [
-            "gdbus", "call", "--session",
-            "--dest", self.dbus_dest,
-            "--object-path", self.dbus_path,
-            "--method", "org.freedesktop.DBus.Properties.Get",
-            self.dbus_interface, property_name
-        ]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            raise PomodoroError(f"Property get failed: {e.stderr}")
+
+    def _call_dbus(self, method: str, *args) -> None:
+        """Make D-Bus call to Gnome Pomodoro."""
+        self._state = None
+        if self._connection() is None:
+            self._run_gdbus(f"{self.dbus_interface}.{method}", args, "D-Bus call failed")
+        else:
+            self._invoke(self.dbus_interface, method, args, "D-Bus call failed")
+
+    def _get_property(self, property_name: str) -> Any:
+        """Get a property from Gnome Pomodoro (string properties only without PyGObject)."""
+        if self._connection() is None:
+            result = self._run_gdbus("org.freedesktop.DBus.Properties.Get",
+                                     (self.dbus_interface, property_name), "Property get failed")
+            match = _STATE_RE.search(result)
+            return match.group(1) if match else None
+        reply = self._invoke("org.freedesktop.DBus.Properties", "Get",
+                             (self.dbus_interface, property_name), "Property get failed")
+        return reply.unpack()[0]
     
     def start(self) -> None:
         """Start a work session (Pomodoro)."""
@@ -74,24 +125,24 @@ class PomodoroIntegration:
     
     def set_short_break(self) -> None:
         """Switch immediately to a short break."""
-        self._call_dbus("SetState", "'short-break'", "0.0")
+        self._call_dbus("SetState", "short-break", 0.0)
     
     def set_work_duration(self, minutes: int = 20) -> None:
         """Set work (pomodoro) length in minutes."""
         seconds = minutes * 60
-        self._call_dbus("SetStateDuration", "'pomodoro'", f"{seconds}.0")
+        self._call_dbus("SetStateDuration", "pomodoro", float(seconds))
     
     def get_current_state(self) -> Optional[str]:
-        """Get current pomodoro state."""
+        """Get current pomodoro state (cached for STATE_TTL seconds)."""
+        now = time.monotonic()
+        if self._state is not None and now - self._state[0] < self.STATE_TTL:
+            return self._state[1]
         try:
-            result = self._get_property("State")
-            # Extract state from D-Bus variant format like "(<'pomodoro'>,)"
-            if "'" in result:
-                state = result.split("'")[1]
-                return state
-            return None
+            state = self._get_property("State") or None
         except PomodoroError:
-            return None
+            state = None
+        self._state = (now, state)
+        return state
     
     def is_running(self) -> bool:
         """Check if pomodoro timer is in work state."""
@@ -99,25 +150,36 @@ class PomodoroIntegration:
         return state == "pomodoro"
     
     def is_available(self) -> bool:
-        """Check if Gnome Pomodoro is available."""
-        try:
-            self.get_current_state()
-            return True
-        except PomodoroError:
-            return False
+        """Check if Gnome Pomodoro is available (re-probed after AVAILABILITY_TTL)."""
+        now = time.monotonic()
+        if self._available is None or now - self._available[0] >= self.AVAILABILITY_TTL:
+            try:
+                self.get_current_state()
+                available = True
+            except PomodoroError:
+                available = False
+            self._available = (now, available)
+        return self._available[1]
+
+    def invalidate_availability(self) -> None:
+        """Forget the availability probe and state so the next check runs them again."""
+        self._available = None
+        self._state = None
     
     def get_all_properties(self) -> str:
         """Get all properties from Gnome Pomodoro (for debugging)."""
-        cmd = [
-            "gdbus", "call", "--session",
-            "--dest", self.dbus_dest,
-            "--object-path", self.dbus_path,
-            "--method", "org.freedesktop.DBus.Properties.GetAll",
-            self.dbus_interface
-        ]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            raise PomodoroError(f"Get all properties failed: {e.stderr}")
\ No newline at end of file
+        if self._connection() is None:
+            return self._run_gdbus("org.freedesktop.DBus.Properties.GetAll",
+                                   (self.dbus_interface,), "Get all properties failed")
+        reply = self._invoke("org.freedesktop.DBus.Properties", "GetAll",
+                             (self.dbus_interface,), "Get all properties failed")
+        return reply.print_(True)
+
+
+@lru_cache(maxsize=1)
+def get_pomodoro() -> PomodoroIntegration:
+    """Return the process-wide Pomodoro integration.
+
+    Sharing one instance lets every caller reuse the cached availability probe.
+    """
+    return PomodoroIntegration()
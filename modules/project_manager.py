@@ -1,46 +1,79 @@
 """
 Project management functionality for Clockify CLI.
 """
-from typing import List, Optional, Tuple
+import sys
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from .api_client import ClockifyAPI
+from .client_manager import ClientManager
 from .config import ClockifyConfig
-from .utils import get_user_selection
+from .utils import get_user_selection, index_by_name
+
+if TYPE_CHECKING:
+    from .data_cache import DataCache
+
+_project_name = itemgetter("name")
 
 
 class ProjectManager:
     """Handles project selection and management."""
 
-    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, cache=None):
+    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, cache: Optional["DataCache"] = None) -> None:
         self.api = api
         self.config = config
         self.cache = cache
+        # Lookup indexes for the project list they were built from
+        self._indexed_projects: Optional[List[dict]] = None
+        self._by_id: Dict[str, dict] = {}
+        self._by_name: Dict[str, dict] = {}
+        self._by_client: Dict[Optional[str], List[dict]] = {}
 
     def get_projects(self) -> List[dict]:
         """Get all projects from the workspace."""
         if self.cache:
             return self.cache.get_projects()
         return self.api.get_projects()
+
+    def invalidate_projects(self) -> None:
+        """Force the next get_projects() to fetch the project list again."""
+        if self.cache:
+            self.cache.invalidate_projects()
+        else:
+            self.api.invalidate_projects()
+        self._indexed_projects = None
     
     def get_project_names(self) -> List[str]:
         """Get list of project names."""
         projects = self.get_projects()
-        return [project["name"] for project in projects]
+        return list(map(_project_name, projects))
+
+    def _index(self) -> Tuple[Dict[str, dict], Dict[str, dict], Dict[Optional[str], List[dict]]]:
+        """Return (by ID, by name, by client) indexes, rebuilt whenever the project list changes."""
+        projects = self.get_projects()
+        if projects is not self._indexed_projects:
+            self._by_id = {project["id"]: project for project in projects}
+            self._by_name = index_by_name(projects)
+            self._by_client = {}
+            for project in projects:
+                self._by_client.setdefault(project.get("clientId"), []).append(project)
+            self._indexed_projects = projects
+        return self._by_id, self._by_name, self._by_client
+
+    def get_projects_for_client(self, client_id: str) -> List[dict]:
+        """Get the projects belonging to a client, in workspace order."""
+        return self._index()[2].get(client_id, [])
     
     def find_project_by_name(self, name: str) -> Optional[dict]:
         """Find project by name."""
-        projects = self.get_projects()
-        for project in projects:
-            if project["name"] == name:
-                return project
-        return None
+        if self.cache:
+            return self.cache.find_project_by_name(name)
+        return self._index()[1].get(name)
     
     def find_project_by_id(self, project_id: str) -> Optional[dict]:
         """Find project by ID."""
-        projects = self.get_projects()
-        for project in projects:
-            if project["id"] == project_id:
-                return project
-        return None
+        if self.cache:
+            return self.cache.find_project_by_id(project_id)
+        return self._index()[0].get(project_id)
     
     def get_current_project(self) -> Optional[dict]:
         """Get the current project from config or active time entry."""
@@ -71,53 +104,48 @@ class ProjectManager:
             print("No projects found")
             return
         
-        print("Available Projects:")
-        for project in projects:
-            print(f"  {project['id']} - {project['name']}")
+        lines = ["Available Projects:"]
+        lines.extend(f"  {project['id']} - {project['name']}" for project in projects)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def select_project_interactive(self) -> Optional[Tuple[str, str]]:
         """Interactively select a project."""
+        client_manager = ClientManager(self.api, self.config, self.cache)
+        # Rebuilt only when the client changes, not on every invalid entry
+        projects = None
         while True:
-            projects = self.get_projects()
-            if not projects:
-                print("No projects found")
-                return None
-
-            # Filter projects by current client if one is set
-            if self.config.client_id:
-                filtered_projects = [
-                    project for project in projects
-                    if project.get("clientId") == self.config.client_id
-                ]
-
-                if not filtered_projects:
-                    from .client_manager import ClientManager
-                    client_manager = ClientManager(self.api, self.config, self.cache)
-                    current_client = client_manager.get_current_client()
-                    client_name = current_client["name"] if current_client else self.config.client_id
-                    print(f"No projects found for client: {client_name}")
+            if projects is None:
+                projects = self.get_projects()
+                if not projects:
+                    print("No projects found")
                     return None
 
-                projects = filtered_projects
+                current_client = client_manager.get_current_client() if self.config.client_id else None
+
+                # Filter projects by current client if one is set
+                if self.config.client_id:
+                    filtered_projects = self.get_projects_for_client(self.config.client_id)
+
+                    if not filtered_projects:
+                        client_name = current_client["name"] if current_client else self.config.client_id
+                        print(f"No projects found for client: {client_name}")
+                        return None
+
+                    projects = filtered_projects
 
-            project_names = [project["name"] for project in projects]
-            current_project_name = self.get_current_project_name()
+                project_names = list(map(_project_name, projects))
+                current_project_name = self.get_current_project_name()
 
             # Display current client if set
-            if self.config.client_id:
-                from .client_manager import ClientManager
-                client_manager = ClientManager(self.api, self.config, self.cache)
-                current_client = client_manager.get_current_client()
-                if current_client:
-                    print(f"\nCurrent Client: {current_client['name']}")
+            if current_client:
+                print(f"\nCurrent Client: {current_client['name']}")
 
             # Display projects with option 0 to select client
-            print("\nAvailable Projects:\n")
-            print(" 0. [Select Client]")
+            lines = ["\nAvailable Projects:\n", " 0. [Select Client]"]
             for i, project_name in enumerate(project_names, 1):
                 marker = " (current)" if current_project_name and project_name == current_project_name else ""
-                print(f"{i:2d}. {project_name}{marker}")
-            print()
+                lines.append(f"{i:2d}. {project_name}{marker}")
+            sys.stdout.write("\n".join(lines) + "\n\n")
 
             # Get user input
             try:
@@ -134,14 +162,13 @@ class ProjectManager:
 
                 # Handle "0" to open client selection
                 if selection == "0":
-                    from .client_manager import ClientManager
-                    client_manager = ClientManager(self.api, self.config, self.cache)
                     result = client_manager.select_client_interactive()
                     if result:
                         client_id, client_name = result
                         client_manager.set_current_client(client_id)
                         print()
-                        # Loop back to project selection
+                        # Loop back to project selection for the new client
+                        projects = None
                         continue
                     else:
                         # Client selection cancelled, return to project selection
@@ -12,7 +12,7 @@ from .utils import get_user_selection
 class TaskManager:
     """Handles task selection from time entry history."""
     
-    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, project_manager: ProjectManager):
+    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, project_manager: ProjectManager) -> None:
         self.api = api
         self.config = config
         self.project_manager = project_manager
@@ -254,12 +254,12 @@ class TaskManager:
                 # Import here to avoid circular imports
                 from .time_tracker import TimeTracker
                 from .api_client import ClockifyAPI
-                from .pomodoro import PomodoroIntegration
+                from .pomodoro import get_pomodoro
                 
                 # Create instances
                 api = ClockifyAPI(self.config.token, self.config.workspace_id)
                 time_tracker = TimeTracker(api, self.config, self.project_manager)
-                pomodoro = PomodoroIntegration()
+                pomodoro = get_pomodoro()
                 
                 was_tracking = time_tracker.is_tracking()
                 was_pomodoro_running = False
@@ -304,11 +304,11 @@ class TaskManager:
             try:
                 from .time_tracker import TimeTracker
                 from .api_client import ClockifyAPI
-                from .pomodoro import PomodoroIntegration
+                from .pomodoro import get_pomodoro
                 
                 api = ClockifyAPI(self.config.token, self.config.workspace_id)
                 time_tracker = TimeTracker(api, self.config, self.project_manager)
-                pomodoro = PomodoroIntegration()
+                pomodoro = get_pomodoro()
                 
                 was_clockify_running = getattr(self, '_was_clockify_running', False)
                 was_pomodoro_running = getattr(self, '_was_pomodoro_running', False)
@@ -2,17 +2,20 @@
 Task and Description management functionality for Clockify CLI.
 Handles the hierarchy: Client > Project > Task > Description
 """
-from typing import List, Optional, Dict, Tuple
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
 from .api_client import ClockifyAPI
 from .config import ClockifyConfig
 from .project_manager import ProjectManager
 from .utils import get_user_selection
 
+if TYPE_CHECKING:
+    from .data_cache import DataCache
+
 
 class TaskDescriptionManager:
     """Handles task selection and description management."""
 
-    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, project_manager: ProjectManager, cache=None):
+    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, project_manager: ProjectManager, cache: Optional["DataCache"] = None) -> None:
         self.api = api
         self.config = config
         self.project_manager = project_manager
@@ -35,24 +38,7 @@ class TaskDescriptionManager:
         else:
             entries = self.api.get_time_entries(limit)
 
-        # Process entries to extract descriptions
-        descriptions = set()
-        for entry in entries:
-            entry_project_id = entry.get("projectId")
-            entry_task_id = entry.get("taskId")
-            entry_description = entry.get("description", "").strip()
-
-            # Must be from the same project and have a description
-            if entry_project_id != project_id or not entry_description:
-                continue
-
-            # Include entries that either:
-            # 1. Have the matching task ID, OR
-            # 2. Have no task ID (legacy entries from before formal tasks were assigned)
-            if entry_task_id == task_id or entry_task_id is None:
-                descriptions.add(entry_description)
-
-        return sorted(list(descriptions))
+        return self.api.get_descriptions_for_task(project_id, task_id, task_name, entries=entries)
 
     def get_recent_combinations(self, limit: int = 5) -> List[Dict]:
         """Get the N most recent unique client-project-task-description combinations.
@@ -375,12 +361,12 @@ class TaskDescriptionManager:
             try:
                 # Import here to avoid circular imports
                 from .time_tracker import TimeTracker
-                from .pomodoro import PomodoroIntegration
+                from .pomodoro import get_pomodoro
                 
                 # Create instances
                 api = ClockifyAPI(self.config.token, self.config.workspace_id)
                 time_tracker = TimeTracker(api, self.config, self.project_manager)
-                pomodoro = PomodoroIntegration()
+                pomodoro = get_pomodoro()
                 
                 was_tracking = time_tracker.is_tracking()
                 was_pomodoro_running = False
@@ -422,9 +408,10 @@ class TaskDescriptionManager:
             print(f"Project changed to: {project_name}")
         
         # Update task and description
-        self.config.task_id = task_id
-        self.config.task_name = task_name
-        self.config.description = description
+        with self.config.batch():
+            self.config.task_id = task_id
+            self.config.task_name = task_name
+            self.config.description = description
 
         if task_name:
             print(f"Task set to: {task_name}")
@@ -436,11 +423,11 @@ class TaskDescriptionManager:
         if stop_timer and hasattr(self, '_should_resume_tracking') and self._should_resume_tracking:
             try:
                 from .time_tracker import TimeTracker
-                from .pomodoro import PomodoroIntegration
+                from .pomodoro import get_pomodoro
                 
                 api = ClockifyAPI(self.config.token, self.config.workspace_id)
                 time_tracker = TimeTracker(api, self.config, self.project_manager)
-                pomodoro = PomodoroIntegration()
+                pomodoro = get_pomodoro()
                 
                 was_clockify_running = getattr(self, '_was_clockify_running', False)
                 was_pomodoro_running = getattr(self, '_was_pomodoro_running', False)
@@ -585,8 +572,9 @@ class TaskDescriptionManager:
 
                 # Clear current task if it was the deleted one
                 if self.config.task_id == task_to_delete["id"]:
-                    self.config.task_id = None
-                    self.config.task_name = None
+                    with self.config.batch():
+                        self.config.task_id = None
+                        self.config.task_name = None
                     print("Cleared current task setting as it was deleted.")
 
                 return True
@@ -6,18 +6,21 @@ import time
 from .api_client import ClockifyAPI, ClockifyAPIError
 from .config import ClockifyConfig
 from .project_manager import ProjectManager
-from .pomodoro import PomodoroIntegration, PomodoroError
+from .pomodoro import PomodoroError, get_pomodoro
 from .utils import show_notification, format_duration, calculate_elapsed_minutes
 
+# Pomodoro states during which tracking must not start
+BREAK_STATES = frozenset({"short-break", "long-break"})
+
 
 class TimeTracker:
     """Handles time entry start/stop operations and info display."""
 
-    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, project_manager: ProjectManager):
+    def __init__(self, api: ClockifyAPI, config: ClockifyConfig, project_manager: ProjectManager) -> None:
         self.api = api
         self.config = config
         self.project_manager = project_manager
-        self.pomodoro = PomodoroIntegration()
+        self.pomodoro = get_pomodoro()
         self._last_stop_time = None
     
     def is_tracking(self) -> bool:
@@ -83,7 +86,7 @@ class TimeTracker:
             current_state = self.pomodoro.get_current_state()
             # Only block if actively in a break state (short-break or long-break)
             # Allow starting if state is null/None (idle) or already "pomodoro"
-            if current_state in ["short-break", "long-break"]:
+            if current_state in BREAK_STATES:
                 print(f"Pomodoro in break state ({current_state}), skipping Clockify start")
                 return False
 
@@ -109,8 +112,9 @@ class TimeTracker:
             )
             
             if entry and entry.get("id"):
-                self.config.current_entry_id = entry["id"]
-                self.config.last_stop_time = None  # Clear stop time cooldown
+                with self.config.batch():
+                    self.config.current_entry_id = entry["id"]
+                    self.config.last_stop_time = None  # Clear stop time cooldown
                 print(f"Time entry started successfully (ID: {entry['id']})")
                 show_notification(f"Time entry started: {description_text}")
                 return True
@@ -134,8 +138,9 @@ class TimeTracker:
             result = self.api.stop_time_entry()
             
             if result and result.get("id"):
-                self.config.current_entry_id = None  # Clear state
-                self.config.last_stop_time = time.time()  # Record stop time for cooldown
+                with self.config.batch():
+                    self.config.current_entry_id = None  # Clear state
+                    self.config.last_stop_time = time.time()  # Record stop time for cooldown
                 description = result.get('description', 'Unknown')
                 print(f"Time entry stopped successfully (ID: {result['id']})")
                 show_notification(f"Time entry stopped: {description}")
@@ -147,8 +152,9 @@ class TimeTracker:
         except ClockifyAPIError as e:
             print(f"Error stopping time entry: {e}")
             # Clear state file even if API call failed
-            self.config.current_entry_id = None
-            self.config.last_stop_time = time.time()  # Record stop time for cooldown
+            with self.config.batch():
+                self.config.current_entry_id = None
+                self.config.last_stop_time = time.time()  # Record stop time for cooldown
             return False
     
     def change_description(self, new_description: str) -> bool:
@@ -1,11 +1,67 @@
 """
 Utility functions for Clockify CLI.
 """
+import json
 import subprocess
 import tempfile
 import os
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (2-space indent if requested), using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj).encode()
+
+
+def index_by_name(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index items by name; the first item wins on duplicate names, as with a linear scan."""
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        by_name.setdefault(item["name"], item)
+    return by_name
+
+
+def write_atomic(path: Union[str, "os.PathLike[str]"], data: bytes) -> None:
+    """Replace a file's contents so readers never see it half-written.
+
+    The data goes to a temporary sibling that is synced and renamed over the
+    target, keeping the permissions of the file being replaced.
+    """
+    path = os.fspath(path)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, os.stat(path).st_mode)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def format_duration(start_time: str, end_time: Optional[str] = None) -> str:
@@ -203,7 +259,7 @@ def display_markdown(content: str, language: str = "markdown", prettify: bool =
         print(content)
 
 
-def get_user_selection(items: list, prompt: str = "Select an item", current_item: str = None, use_bat: bool = True) -> Optional[tuple]:
+def get_user_selection(items: list, prompt: str = "Select an item", current_item: Optional[str] = None, use_bat: bool = True) -> Optional[tuple]:
     """Interactive user selection from a list of items.
 
     Args:
@@ -10,6 +10,7 @@ from collections import defaultdict
 
 from modules.config import ClockifyConfig
 from modules.api_client import ClockifyAPI, ClockifyAPIError
+from modules.data_cache import DataCache
 
 
 class TimeReportProcessor:
@@ -18,6 +19,8 @@ class TimeReportProcessor:
     def __init__(self, config: ClockifyConfig):
         self.config = config
         self.api = ClockifyAPI(config.token, config.workspace_id)
+        # Indexes each project's tasks by name for the per-row lookups
+        self.data_cache = DataCache(self.api)
         
         # Cache for efficiency
         self.projects_cache = {}
@@ -60,7 +63,10 @@ class TimeReportProcessor:
             return self.tasks_cache[cache_key]
         
         # Check if task exists
-        existing_task = self.api.find_task_by_name(project_id, task_name)
+        try:
+            existing_task = self.data_cache.find_task_by_name(project_id, task_name)
+        except ClockifyAPIError:
+            existing_task = None
         if existing_task:
             task_id = existing_task["id"]
             self.tasks_cache[cache_key] = task_id
@@ -71,6 +77,7 @@ class TimeReportProcessor:
             print(f"Creating task '{task_name}' in project '{project_name}'...")
             new_task = self.api.create_task(project_id, task_name)
             task_id = new_task["id"]
+            self.data_cache.invalidate_tasks(project_id)
             
             self.tasks_cache[cache_key] = task_id
             self.created_tasks[cache_key] = task_name